@@ -1,16 +1,78 @@
 #!python
 
+from bisect import bisect_left
+from collections import OrderedDict
 import sys
 import time
+import unicodedata
+
+# Character after every other character, to find the end of a prefix's range
+# in a sorted list of strings
+MAX_CHARACTER = chr(sys.maxunicode)
+
+# Number of bytes read from vocabulary files at a time
+READ_BUFFER_SIZE = 1 << 20
+
+# All algorithms supported by autocomplete_setup and autocomplete
+ALGORITHMS = ('linear_search', 'trie', 'frozen_trie', 'bisect')
 
 
 def get_lines(filename='/usr/share/dict/words'):
     """Return a list of strings on separate lines in the given text file with
     any leading and trailing whitespace characters removed from each line."""
     # Open file and remove whitespace from each line
-    with open(filename) as file:
-        lines = [line.strip() for line in file]
-    return lines
+    return list(iter_lines(filename))
+
+
+def iter_lines(filename, encoding=None, buffer_size=READ_BUFFER_SIZE):
+    """Return a generator of the lines in the given text file with leading
+    and trailing whitespace removed, read in large buffered chunks. Lines are
+    decoded with the given encoding, or else as UTF-8 with any byte order
+    mark at the start of the file removed, falling back to Latin-1 for lines
+    that are not valid UTF-8, so a dictionary file in a legacy 8-bit encoding
+    does not stop the whole file from loading."""
+    if encoding is not None:
+        # Decode in text mode, where multi-byte encodings such as UTF-16
+        # split lines on decoded newlines instead of on newline bytes
+        with open(filename, encoding=encoding,
+                  buffering=buffer_size) as file:
+            for line in file:
+                yield line.strip()
+        return
+    with open(filename, 'rb', buffering=buffer_size) as file:
+        # Only the first line can start with a byte order mark
+        codec = 'utf-8-sig'
+        for line in file:
+            try:
+                yield line.decode(codec).strip()
+            except UnicodeDecodeError:
+                yield line.decode('latin-1').strip()
+            codec = 'utf-8'
+
+
+def iter_words(filename='/usr/share/dict/words', casefold=False,
+               normalize=None, dedupe=False, encoding=None):
+    """Return a generator of the words on separate lines in the given text
+    file, skipping blank lines, so words can be inserted into a structure as
+    they are read without first holding a list of every line in memory.
+    Each word is put in the given Unicode normal form (such as 'NFC') if any,
+    then case-folded if casefold is True. If dedupe is True, words already
+    yielded are skipped, which keeps a set of them in memory; PrefixTree
+    ignores repeated strings anyway and FrozenPrefixTree skips repeated
+    strings in its sorted input, so they do not need it."""
+    seen = set() if dedupe else None
+    for word in iter_lines(filename, encoding):
+        if not word:
+            continue
+        if normalize is not None:
+            word = unicodedata.normalize(normalize, word)
+        if casefold:
+            word = word.casefold()
+        if seen is not None:
+            if word in seen:
+                continue
+            seen.add(word)
+        yield word
 
 
 def generate_prefixes(vocabulary):
@@ -21,14 +83,24 @@ def generate_prefixes(vocabulary):
 
 def autocomplete_setup(vocabulary, algorithm='linear_search'):
     """Return the main data structure needed to set up autocomplete using the
-    given vocabulary and algorithm, specified as linear_search, trie, etc."""
+    given vocabulary and algorithm, specified as linear_search, trie, etc.
+    The vocabulary can be a list or any iterable of strings, such as a
+    generator from iter_words, which the tries consume without a list."""
     if algorithm == 'linear_search':
         # Use the given vocabulary list
-        return vocabulary
+        return vocabulary if isinstance(vocabulary, list) else list(vocabulary)
     elif algorithm == 'trie':
-        from trie import Trie
+        from prefixtree import PrefixTree
         # Create a trie structure with the vocabulary
-        return Trie(vocabulary)
+        return PrefixTree(vocabulary)
+    elif algorithm == 'frozen_trie':
+        from frozenprefixtree import FrozenPrefixTree
+        # Create a flat array-backed trie with the sorted vocabulary
+        return FrozenPrefixTree(sorted(vocabulary))
+    elif algorithm == 'bisect':
+        # Sort the vocabulary once so each prefix is a contiguous range
+        return sorted(vocabulary)
+    raise ValueError(f'Unknown algorithm: {algorithm!r}')
 
 
 def autocomplete(prefix, structure, algorithm='linear_search'):
@@ -37,14 +109,136 @@ def autocomplete(prefix, structure, algorithm='linear_search'):
     if algorithm == 'linear_search':
         # Search the list using linear search
         return [word for word in structure if word.startswith(prefix)]
-    elif algorithm == 'trie':
+    elif algorithm in ('trie', 'frozen_trie'):
         # Search the trie structure for the prefix
-        return structure.search(prefix)
+        return structure.complete(prefix)
+    elif algorithm == 'bisect':
+        # Binary search the sorted list for the range starting with the prefix
+        start = bisect_left(structure, prefix)
+        end = bisect_left(structure, prefix + MAX_CHARACTER, start)
+        return structure[start:end]
+
+
+def autocomplete_many(prefixes, structure, algorithm='linear_search'):
+    """Return a dict mapping each of the given prefixes to all vocabulary
+    entries that start with it using the given structure and algorithm.
+    Trie structures share the walk down to each prefix between neighbours in
+    sorted order instead of starting every search from the root."""
+    if algorithm in ('trie', 'frozen_trie'):
+        return structure.complete_many(prefixes)
+    return {prefix: autocomplete(prefix, structure, algorithm)
+            for prefix in prefixes}
+
+
+class AutocompleteCache(object):
+    """AutocompleteCache: A least recently used cache around autocomplete
+    that remembers where the completions of recent prefixes are in the given
+    structure: the trie node reached, the range of a sorted list, or the list
+    of completions found by linear search. A prefix that extends a cached
+    prefix, as when a user types one more character, is answered by going on
+    from the cached position instead of starting over from the root or
+    scanning the whole vocabulary again. Lists found by linear search hold
+    copies of their completions, so they are bounded by a total number of
+    items as well, and one longer than that bound is not cached at all.
+    The cache does not see changes to the structure, so call clear after
+    inserting or deleting strings."""
+
+    def __init__(self, structure, algorithm='linear_search', max_size=1024,
+                 max_items=1 << 16):
+        """Initialize this cache around the given structure and algorithm
+        to remember at most the given number of prefixes, holding at most the
+        given total number of completions found by linear search."""
+        self.structure = structure
+        self.algorithm = algorithm
+        self.max_size = max_size
+        self.max_items = max_items
+        # Positions of recent prefixes, from least to most recently used
+        self.entries = OrderedDict()
+        # Total number of completions held in lists found by linear search
+        self.num_items = 0
+        # Prefixes found in the cache, derived from a shorter cached prefix,
+        # or searched from scratch
+        self.hits = 0
+        self.derived = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Return a dict of the counters of this cache."""
+        return {'hits': self.hits, 'derived': self.derived,
+                'misses': self.misses, 'size': len(self.entries),
+                'items': self.num_items}
+
+    def clear(self) -> None:
+        """Forget every cached prefix, which must be done whenever strings
+        are inserted into or deleted from the structure."""
+        self.entries.clear()
+        self.num_items = 0
+
+    def autocomplete(self, prefix) -> list:
+        """Return all vocabulary entries that start with the given prefix."""
+        entry = self._find_entry(prefix)
+        if self.algorithm == 'linear_search':
+            return list(entry)
+        elif self.algorithm == 'bisect':
+            start, end = entry
+            return self.structure[start:end]
+        elif self.algorithm in ('trie', 'frozen_trie'):
+            return self.structure.complete_from(*entry)
+
+    def _find_entry(self, prefix):
+        """Return the cached position of the given prefix, or locate it from
+        the cached position of its longest cached prefix and cache it."""
+        entries = self.entries
+        if prefix in entries:
+            self.hits += 1
+            entries.move_to_end(prefix)
+            return entries[prefix]
+        for length in range(len(prefix) - 1, -1, -1):
+            shorter = prefix[:length]
+            if shorter in entries:
+                self.derived += 1
+                entries.move_to_end(shorter)
+                entry = self._locate(prefix, shorter, entries[shorter])
+                break
+        else:
+            self.misses += 1
+            entry = self._locate(prefix, None, None)
+        items = len(entry) if self.algorithm == 'linear_search' else 0
+        if self.max_size > 0 and items <= self.max_items:
+            entries[prefix] = entry
+            self.num_items += items
+            while len(entries) > self.max_size or \
+                    self.num_items > self.max_items:
+                _, evicted = entries.popitem(last=False)
+                if self.algorithm == 'linear_search':
+                    self.num_items -= len(evicted)
+        return entry
+
+    def _locate(self, prefix, shorter, entry):
+        """Return the position of the given prefix, from the given position
+        of the given shorter prefix of it, or from scratch if it is None."""
+        structure = self.structure
+        if self.algorithm == 'linear_search':
+            words = structure if shorter is None else entry
+            return [word for word in words if word.startswith(prefix)]
+        elif self.algorithm == 'bisect':
+            start, end = (0, len(structure)) if shorter is None else entry
+            start = bisect_left(structure, prefix, start, end)
+            end = bisect_left(structure, prefix + MAX_CHARACTER, start, end)
+            return start, end
+        elif self.algorithm in ('trie', 'frozen_trie'):
+            return structure.find_prefix_node(prefix, entry)
 
 
 def main():
     """Read command-line arguments and test autocomplete algorithms."""
-    if len(sys.argv) == 1:
+    if len(sys.argv) > 1 and sys.argv[1] == 'benchmark':
+        # Benchmark all algorithms with the remaining arguments
+        from autocomplete_benchmark import main as benchmark_main
+        benchmark_main(sys.argv[2:])
+        return
+
+    elif len(sys.argv) == 1:
         script = sys.argv[0]  # Get script file name
         print('Usage: {} prefix'.format(script))
         print('Test autocomplete with dictionary words and the given prefix')
@@ -54,6 +248,11 @@ def main():
         print('Usage: {} prefixes-file vocabulary-file'.format(script))
         print('Test autocomplete with the given prefixes and vocabulary files')
         print('Example: {} prefixes.txt /usr/share/dict/words'.format(script))
+        print('A vocabulary-file ending in .trie is memory-mapped as an index')
+        print('built by: frozenprefixtree.py vocabulary-file index-file')
+        print()
+        print('Usage: {} benchmark [options]'.format(script))
+        print('Benchmark all algorithms, see {} benchmark --help'.format(script))
         return
 
     elif len(sys.argv) == 2:
@@ -62,15 +261,15 @@ def main():
         vocabulary = get_lines('/usr/share/dict/words')
 
         # Start the clock for benchmarking
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Set up autocomplete and mark the clock
         structure = autocomplete_setup(vocabulary)
-        setup_time = time.time()
+        setup_time = time.perf_counter()
 
         # Run autocomplete and mark the clock
         completions = autocomplete(prefix, structure)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         print('Vocabulary size: {}'.format(len(vocabulary)))
         print('Completions of {}: {}'.format(prefix, ', '.join(completions)))
@@ -80,28 +279,46 @@ def main():
         print('Total time elapsed: {:.6f} sec'.format(end_time - start_time))
 
     elif len(sys.argv) == 3:
-        # Open the given vocabulary and prefixes files
-        vocabulary = get_lines(sys.argv[2])
+        from frozenprefixtree import FrozenPrefixTree
+        # Open the given prefixes file
         prefixes = get_lines(sys.argv[1])
 
-        # Start the clock for benchmarking
-        start_time = time.time()
+        if sys.argv[2].endswith(FrozenPrefixTree.FILE_EXTENSION):
+            # Map the prebuilt index file instead of reading words
+            algorithm = 'frozen_trie'
+            start_time = time.perf_counter()
+            structure = FrozenPrefixTree.load(sys.argv[2])
+            setup_time = time.perf_counter()
+        else:
+            # Open the given vocabulary file and complete all prefixes with
+            # a trie, which shares work between prefixes in one batch
+            algorithm = 'trie'
+            vocabulary = get_lines(sys.argv[2])
 
-        # Set up autocomplete and mark the clock
-        structure = autocomplete_setup(vocabulary)
-        setup_time = time.time()
+            # Start the clock for benchmarking
+            start_time = time.perf_counter()
+
+            # Set up autocomplete and mark the clock
+            structure = autocomplete_setup(vocabulary, algorithm)
+            setup_time = time.perf_counter()
 
-        # Run autocomplete with each prefix
+        # Run autocomplete with all prefixes at once
+        all_completions = autocomplete_many(prefixes, structure, algorithm)
         num_completions = 0
         for prefix in prefixes:
-            completions = autocomplete(prefix, structure)
+            completions = all_completions[prefix]
             num_completions += len(completions)
             # print('Completions of {}: {}'.format(prefix, ', '.join(completions)))
 
         # Mark the clock
-        end_time = time.time()
+        end_time = time.perf_counter()
+        if algorithm == 'frozen_trie':
+            vocabulary_size = structure.size
+            structure.close()
+        else:
+            vocabulary_size = len(vocabulary)
 
-        print('Vocabulary size: {}'.format(len(vocabulary)))
+        print('Vocabulary size: {}'.format(vocabulary_size))
         print('Found {} total completions of {} prefixes'
               .format(num_completions, len(prefixes)))
         print()
@@ -0,0 +1,187 @@
+#!python
+
+from autocomplete import (ALGORITHMS, autocomplete, autocomplete_setup,
+                          generate_prefixes, get_lines, iter_words)
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import string
+import time
+import tracemalloc
+
+# Directory of this script, where the default prefixes files are
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# Default vocabulary sizes and prefixes files to benchmark with
+DEFAULT_SIZES = [10000, 100000]
+DEFAULT_PREFIXES_FILES = [os.path.join(DIRECTORY, 'prefixes5.txt'),
+                          os.path.join(DIRECTORY, 'prefixes15.txt')]
+
+# Columns of each benchmark result, in the order they are written
+FIELDS = ['algorithm', 'vocabulary_size', 'queries', 'num_queries',
+          'num_completions', 'setup_ns', 'p50_ns', 'p99_ns', 'peak_bytes']
+
+
+def algorithm_list(value):
+    """Return the list of algorithms in the given comma-separated string, or
+    raise argparse.ArgumentTypeError if any of them is unknown."""
+    algorithms = value.split(',')
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise argparse.ArgumentTypeError(
+                f'unknown algorithm {algorithm!r} (choose from '
+                f'{", ".join(ALGORITHMS)})')
+    return algorithms
+
+
+def generate_vocabulary(size, seed=0, min_length=2, max_length=12):
+    """Return a list of the given number of unique random lowercase words
+    with lengths in the given range, generated from the given random seed."""
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase
+    words = set()
+    while len(words) < size:
+        length = rng.randint(min_length, max_length)
+        words.add(''.join(rng.choice(letters) for _ in range(length)))
+    return list(words)
+
+
+def percentile(sorted_values, percent):
+    """Return the given percentile of the given sorted list of values using
+    the nearest-rank method."""
+    if not sorted_values:
+        return 0
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def measure_setup_memory(vocabulary, algorithm):
+    """Return the peak number of bytes allocated while setting up the given
+    algorithm with the given vocabulary, traced in a separate setup run so
+    tracing does not slow down the timed setup."""
+    tracemalloc.start()
+    try:
+        structure = autocomplete_setup(vocabulary, algorithm)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del structure
+    return peak
+
+
+def benchmark(vocabulary, algorithm, query_sets):
+    """Return a list of benchmark results, one per named list of prefixes in
+    the given dict of query sets, for the given algorithm and vocabulary."""
+    start = time.perf_counter_ns()
+    structure = autocomplete_setup(vocabulary, algorithm)
+    setup_ns = time.perf_counter_ns() - start
+    peak_bytes = measure_setup_memory(vocabulary, algorithm)
+
+    results = []
+    for name, prefixes in query_sets.items():
+        latencies = []
+        num_completions = 0
+        for prefix in prefixes:
+            start = time.perf_counter_ns()
+            completions = autocomplete(prefix, structure, algorithm)
+            latencies.append(time.perf_counter_ns() - start)
+            num_completions += len(completions)
+        latencies.sort()
+        results.append({
+            'algorithm': algorithm,
+            'vocabulary_size': len(vocabulary),
+            'queries': name,
+            'num_queries': len(prefixes),
+            'num_completions': num_completions,
+            'setup_ns': setup_ns,
+            'p50_ns': percentile(latencies, 50),
+            'p99_ns': percentile(latencies, 99),
+            'peak_bytes': peak_bytes,
+        })
+    return results
+
+
+def write_results(results, filename):
+    """Write the given benchmark results to the given file as JSON if its
+    name ends with .json, or as CSV otherwise."""
+    with open(filename, 'w', newline='') as file:
+        if filename.endswith('.json'):
+            json.dump(results, file, indent=2)
+        else:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(results)
+
+
+def print_result(result):
+    """Print the given benchmark result as one row of a table."""
+    print('{algorithm:>13} {vocabulary_size:>9} {queries:>14} '
+          '{num_queries:>6} {num_completions:>9} {setup:>10.3f} '
+          '{p50:>10.1f} {p99:>10.1f} {peak:>10.1f}'.format(
+              setup=result['setup_ns'] / 1e6, p50=result['p50_ns'] / 1e3,
+              p99=result['p99_ns'] / 1e3, peak=result['peak_bytes'] / 2**20,
+              **result))
+
+
+def main(args=None):
+    """Read command-line arguments and benchmark all autocomplete algorithms
+    on synthetic vocabularies of each given size, or on a vocabulary file."""
+    parser = argparse.ArgumentParser(
+        prog='autocomplete.py benchmark',
+        description='Benchmark setup time, query latency and setup memory of '
+                    'all autocomplete algorithms.')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma-separated synthetic vocabulary sizes, '
+                             'from 10000 up to 10000000 words')
+    parser.add_argument('--vocabulary',
+                        help='vocabulary file to use instead of synthetic '
+                             'vocabularies')
+    parser.add_argument('--prefixes', nargs='*', default=DEFAULT_PREFIXES_FILES,
+                        help='prefixes files to query with')
+    parser.add_argument('--generated', type=int, default=1000,
+                        help='number of prefixes generated from the '
+                             'vocabulary to query with')
+    parser.add_argument('--algorithms', type=algorithm_list,
+                        default=','.join(ALGORITHMS),
+                        help='comma-separated algorithms to benchmark')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='random seed for synthetic vocabularies')
+    parser.add_argument('--output',
+                        help='file to write results to, as .json or .csv')
+    options = parser.parse_args(args)
+
+    if options.vocabulary:
+        vocabularies = [list(iter_words(options.vocabulary))]
+    else:
+        vocabularies = (generate_vocabulary(int(size), options.seed)
+                        for size in options.sizes.split(','))
+    algorithms = options.algorithms
+
+    print('{:>13} {:>9} {:>14} {:>6} {:>9} {:>10} {:>10} {:>10} {:>10}'.format(
+        'algorithm', 'words', 'queries', 'count', 'found', 'setup ms',
+        'p50 us', 'p99 us', 'peak MiB'))
+    results = []
+    for vocabulary in vocabularies:
+        query_sets = {os.path.basename(filename): get_lines(filename)
+                      for filename in options.prefixes}
+        if options.generated > 0:
+            prefixes = sorted(generate_prefixes(vocabulary))
+            rng = random.Random(options.seed)
+            count = min(options.generated, len(prefixes))
+            query_sets['generated'] = rng.sample(prefixes, count)
+        for algorithm in algorithms:
+            for result in benchmark(vocabulary, algorithm, query_sets):
+                print_result(result)
+                results.append(result)
+
+    if options.output:
+        write_results(results, options.output)
+        print(f'Wrote {len(results)} results to {options.output}')
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!python3
+
+from autocomplete import get_lines, iter_words
+from autocomplete_benchmark import percentile
+from collections import OrderedDict
+from persistentprefixtree import PersistentPrefixTree
+import argparse
+import asyncio
+import json
+import random
+import time
+
+
+class AutocompleteServer(object):
+    """AutocompleteServer: An asyncio service that answers autocomplete
+    requests from a prefix tree over a line-based TCP protocol:
+    - COMPLETE <prefix> answers with a JSON line of the prefix's completions
+    - INSERT <string> inserts the string and answers with a JSON line
+    - STATS answers with a JSON line of the cache and request counters
+    Completions are computed in a thread pool so the event loop keeps serving
+    while a large subtree is walked, which is safe while strings are inserted
+    because the tree is a PersistentPrefixTree. Concurrent requests for the
+    same prefix share one computation, and results are kept in a size-bounded
+    least recently used cache keyed by prefix. Inserting a string evicts the
+    cached results of its prefixes."""
+
+    def __init__(self, tree, cache_size=1024, limit=10):
+        """Initialize this server with the given prefix tree, the maximum
+        number of cached results and the maximum number of completions to
+        answer each request with, or None for all completions."""
+        self.tree = tree
+        self.cache_size = cache_size
+        self.limit = limit
+        # Results of recent prefixes, from least to most recently used
+        self.cache = OrderedDict()
+        # Futures of computations in progress by prefix and generation
+        self.pending = {}
+        # Number of inserts so far, to tell results computed before them
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.computations = 0
+
+    def stats(self) -> dict:
+        """Return a dict of the counters of this server."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'coalesced': self.coalesced, 'computations': self.computations,
+                'cached': len(self.cache), 'size': self.tree.size}
+
+    async def complete(self, prefix) -> list:
+        """Return the completions of the given prefix from the cache, from a
+        computation already in progress for it, or from a new computation."""
+        if prefix in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(prefix)
+            return self.cache[prefix]
+
+        key = (prefix, self.generation)
+        if key in self.pending:
+            self.coalesced += 1
+            return await asyncio.shield(self.pending[key])
+
+        self.misses += 1
+        self.computations += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self.tree.complete, prefix,
+                                      0, self.limit)
+        self.pending[key] = future
+        try:
+            completions = await future
+        finally:
+            del self.pending[key]
+        # results computed before an insert may be out of date
+        if key[1] == self.generation and self.cache_size > 0:
+            self.cache[prefix] = completions
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return completions
+
+    def insert(self, string) -> None:
+        """Insert the given string into the prefix tree and evict the cached
+        results of every prefix of it."""
+        self.tree.insert(string)
+        self.generation += 1
+        for end in range(len(string) + 1):
+            self.cache.pop(string[:end], None)
+
+    async def handle(self, reader, writer) -> None:
+        """Answer the requests on the given connection until it is closed."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    text = line.decode()
+                except UnicodeDecodeError as error:
+                    response = {'error': f'Request is not UTF-8: {error}'}
+                    writer.write(json.dumps(response).encode() + b'\n')
+                    await writer.drain()
+                    continue
+                command, _, argument = text.rstrip('\r\n').partition(' ')
+                if command == 'COMPLETE':
+                    completions = await self.complete(argument)
+                    response = {'prefix': argument, 'completions': completions}
+                elif command == 'INSERT':
+                    self.insert(argument)
+                    response = {'inserted': argument}
+                elif command == 'STATS':
+                    response = self.stats()
+                else:
+                    response = {'error': f'Unknown command: {command!r}'}
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8021):
+        """Return a started asyncio server that answers requests on the given
+        host and port."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def run_load(host, port, prefixes, connections=10, requests=1000,
+                   seed=0):
+    """Send the given number of COMPLETE requests for random prefixes from
+    the given list over the given number of concurrent connections, and
+    return a sorted list of the latency of each request in nanoseconds."""
+    rng = random.Random(seed)
+    latencies = []
+
+    async def client(count):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(count):
+                prefix = rng.choice(prefixes)
+                start = time.perf_counter_ns()
+                writer.write(f'COMPLETE {prefix}\n'.encode())
+                await writer.drain()
+                await reader.readline()
+                latencies.append(time.perf_counter_ns() - start)
+        finally:
+            writer.close()
+
+    counts = [requests // connections + (index < requests % connections)
+              for index in range(connections)]
+    await asyncio.gather(*(client(count) for count in counts))
+    latencies.sort()
+    return latencies
+
+
+async def serve_forever(options):
+    """Load the vocabulary and serve autocomplete requests until stopped."""
+    # No reader can see the tree yet, so build it in place without copying
+    tree = PersistentPrefixTree.from_sorted(
+        sorted(iter_words(options.vocabulary)))
+    server = AutocompleteServer(tree, options.cache_size, options.limit)
+    listener = await server.serve(options.host, options.port)
+    print(f'Serving {tree.size} strings on {options.host}:{options.port}')
+    async with listener:
+        await listener.serve_forever()
+
+
+async def generate_load(options):
+    """Send load to a running server and print latency and throughput."""
+    prefixes = get_lines(options.prefixes)
+    start = time.perf_counter()
+    latencies = await run_load(options.host, options.port, prefixes,
+                               options.connections, options.requests)
+    elapsed = time.perf_counter() - start
+    print(f'Requests: {len(latencies)} over {options.connections} connections')
+    print(f'Throughput: {len(latencies) / elapsed:.0f} requests/sec')
+    print(f'Latency p50: {percentile(latencies, 50) / 1e3:.1f} us')
+    print(f'Latency p99: {percentile(latencies, 99) / 1e3:.1f} us')
+
+
+def main(args=None):
+    """Read command-line arguments and run the server or the load generator."""
+    parser = argparse.ArgumentParser(description='Autocomplete TCP service.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8021)
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='serve autocomplete requests')
+    serve.add_argument('vocabulary', nargs='?', default='/usr/share/dict/words')
+    serve.add_argument('--cache-size', type=int, default=1024)
+    serve.add_argument('--limit', type=int, default=10)
+    load = commands.add_parser('load', help='send load to a running server')
+    load.add_argument('prefixes')
+    load.add_argument('--connections', type=int, default=10)
+    load.add_argument('--requests', type=int, default=1000)
+    options = parser.parse_args(args)
+
+    if options.command == 'serve':
+        asyncio.run(serve_forever(options))
+    else:
+        asyncio.run(generate_load(options))
+
+
+if __name__ == '__main__':
+    main()
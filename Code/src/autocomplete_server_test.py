@@ -0,0 +1,80 @@
+#!python3
+
+from autocomplete_server import AutocompleteServer, run_load
+from persistentprefixtree import PersistentPrefixTree
+import asyncio
+import json
+import unittest
+
+VOCABULARY = ['axe', 'axle', 'axled', 'axletree', 'bat', 'batch', 'bath']
+
+
+class AutocompleteServerTest(unittest.TestCase):
+
+    def test_complete_caches_and_coalesces(self):
+        server = AutocompleteServer(PersistentPrefixTree(VOCABULARY))
+
+        async def run():
+            # Verify concurrent requests for one prefix share a computation
+            results = await asyncio.gather(*(server.complete('ax')
+                                             for _ in range(5)))
+            assert all(result == ['axe', 'axle', 'axled', 'axletree']
+                       for result in results)
+            assert server.computations == 1
+            assert server.coalesced == 4
+            # Verify a later request is answered from the cache
+            assert await server.complete('ax') == results[0]
+            assert server.hits == 1
+            assert server.computations == 1
+
+        asyncio.run(run())
+
+    def test_cache_is_bounded_and_invalidated(self):
+        server = AutocompleteServer(PersistentPrefixTree(VOCABULARY),
+                                    cache_size=2, limit=None)
+
+        async def run():
+            for prefix in ['a', 'b', 'ba']:
+                await server.complete(prefix)
+            # Verify the least recently used prefix was evicted
+            assert list(server.cache) == ['b', 'ba']
+            server.insert('bake')
+            assert list(server.cache) == []
+            assert await server.complete('ba') == \
+                ['bat', 'batch', 'bath', 'bake']
+
+        asyncio.run(run())
+
+    def test_protocol_and_load(self):
+        server = AutocompleteServer(PersistentPrefixTree(VOCABULARY), limit=2)
+
+        async def run():
+            listener = await server.serve('127.0.0.1', 0)
+            port = listener.sockets[0].getsockname()[1]
+            async with listener:
+                reader, writer = await asyncio.open_connection('127.0.0.1',
+                                                               port)
+                for request in [b'COMPLETE ax\n', b'INSERT bake\n',
+                                b'COMPLETE ba\n', b'NOPE\n',
+                                b'COMPLETE \xffx\n', b'STATS\n']:
+                    writer.write(request)
+                responses = [json.loads(await reader.readline())
+                             for _ in range(6)]
+                writer.close()
+                assert responses[0] == {'prefix': 'ax',
+                                        'completions': ['axe', 'axle']}
+                assert responses[1] == {'inserted': 'bake'}
+                assert responses[2]['completions'] == ['bat', 'batch']
+                assert 'error' in responses[3]
+                # bytes that are not UTF-8 get an error, not a dropped line
+                assert 'error' in responses[4]
+                assert responses[5]['size'] == len(VOCABULARY) + 1
+                latencies = await run_load('127.0.0.1', port, ['a', 'ba'],
+                                           connections=3, requests=20)
+                assert len(latencies) == 20
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+#!python
+
+from autocomplete import (ALGORITHMS, AutocompleteCache, autocomplete_setup,
+                          autocomplete, autocomplete_many, get_lines,
+                          iter_words)
+import autocomplete_benchmark
+from autocomplete_benchmark import FIELDS, benchmark, generate_vocabulary
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+VOCABULARY = ['axe', 'axle', 'axled', 'axletree', 'bat', 'batch', 'bath', 'a']
+PREFIXES = ['ax', 'axle', 'b', 'bat', 'c', 'a', '', 'axles']
+
+
+class AutocompleteTest(unittest.TestCase):
+
+    def test_autocomplete(self):
+        for algorithm in ALGORITHMS:
+            structure = autocomplete_setup(VOCABULARY, algorithm)
+            for prefix in PREFIXES:
+                expected = [word for word in VOCABULARY
+                            if word.startswith(prefix)]
+                completions = autocomplete(prefix, structure, algorithm)
+                self.assertCountEqual(completions, expected)
+
+    def test_autocomplete_many(self):
+        for algorithm in ALGORITHMS:
+            structure = autocomplete_setup(VOCABULARY, algorithm)
+            completions = autocomplete_many(PREFIXES, structure, algorithm)
+            assert set(completions) == set(PREFIXES)
+            for prefix in PREFIXES:
+                expected = autocomplete(prefix, structure, algorithm)
+                assert completions[prefix] == expected
+
+    def test_bisect_returns_sorted_range(self):
+        structure = autocomplete_setup(VOCABULARY, 'bisect')
+        assert structure == sorted(VOCABULARY)
+        assert autocomplete('axl', structure, 'bisect') == \
+            ['axle', 'axled', 'axletree']
+        assert autocomplete('bat', structure, 'bisect') == \
+            ['bat', 'batch', 'bath']
+        assert autocomplete('z', structure, 'bisect') == []
+
+    def test_benchmark_all_algorithms(self):
+        vocabulary = generate_vocabulary(100, seed=1)
+        assert len(set(vocabulary)) == 100
+        query_sets = {'given': PREFIXES, 'none': []}
+        for algorithm in ALGORITHMS:
+            results = benchmark(vocabulary, algorithm, query_sets)
+            assert [result['queries'] for result in results] == \
+                ['given', 'none']
+            for result in results:
+                assert list(result) == FIELDS
+                assert result['algorithm'] == algorithm
+                assert result['p50_ns'] <= result['p99_ns']
+            assert results[0]['num_completions'] == sum(
+                len(autocomplete(prefix, vocabulary)) for prefix in PREFIXES)
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            autocomplete_setup(VOCABULARY, 'hash_table')
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            with self.assertRaises(SystemExit):
+                autocomplete_benchmark.main(['--algorithms', 'trie,hash_table'])
+        assert 'hash_table' in stderr.getvalue()
+
+    def test_cache_derives_longer_prefixes(self):
+        typed = ['a', 'ax', 'axl', 'axle', 'axles', 'axle', 'b', 'bat',
+                 'batc', 'c', 'ca', '', 'ba', 'bath']
+        for algorithm in ALGORITHMS:
+            structure = autocomplete_setup(VOCABULARY, algorithm)
+            cache = AutocompleteCache(structure, algorithm, max_size=4)
+            for prefix in typed:
+                self.assertCountEqual(cache.autocomplete(prefix),
+                                      autocomplete(prefix, structure,
+                                                   algorithm))
+            stats = cache.stats()
+            assert stats['size'] == 4
+            assert stats['hits'] == 1
+            assert stats['hits'] + stats['derived'] + stats['misses'] == \
+                len(typed)
+            assert stats['misses'] == 4
+
+    def test_cache_with_radix_tree(self):
+        from radixtree import RadixTree
+        tree = RadixTree(VOCABULARY)
+        cache = AutocompleteCache(tree, 'trie')
+        for prefix in ['a', 'ax', 'axl', 'axlet', 'axletr', 'axlex', 'b',
+                       'ba', 'bat', 'batc', 'bath', 'bz']:
+            assert cache.autocomplete(prefix) == tree.complete(prefix)
+        assert cache.stats()['misses'] == 2
+
+    def test_cache_bounds_linear_search_items(self):
+        cache = AutocompleteCache(VOCABULARY, 'linear_search', max_items=4)
+        # too many completions to cache at all
+        assert cache.autocomplete('') == VOCABULARY
+        assert cache.stats()['size'] == 0
+        assert cache.autocomplete('ax') == ['axe', 'axle', 'axled', 'axletree']
+        assert cache.autocomplete('b') == ['bat', 'batch', 'bath']
+        # the older list was evicted to keep at most 4 items
+        stats = cache.stats()
+        assert stats['size'] == 1 and stats['items'] == 3
+        assert cache.autocomplete('bat') == ['bat', 'batch', 'bath']
+        assert cache.stats()['derived'] == 1
+
+    def test_cache_clear(self):
+        for algorithm in ['trie', 'linear_search']:
+            structure = autocomplete_setup(VOCABULARY, algorithm)
+            cache = AutocompleteCache(structure, algorithm)
+            assert cache.autocomplete('ba') == ['bat', 'batch', 'bath']
+            if algorithm == 'trie':
+                structure.insert('bake')
+            else:
+                structure.append('bake')
+            cache.clear()
+            assert cache.stats()['size'] == 0
+            self.assertCountEqual(cache.autocomplete('bak'), ['bake'])
+            self.assertCountEqual(cache.autocomplete('ba'),
+                                  ['bake', 'bat', 'batch', 'bath'])
+
+    def test_iter_words(self):
+        lines = ['  Apple\n', '\n', 'apple\r\n', 'cafe\u0301\n', 'caf\u00e9\n',
+                 'Stra\u00dfe', '']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'w', encoding='utf-8', newline='') as file:
+                file.write(''.join(lines))
+            assert list(iter_words(filename)) == \
+                ['Apple', 'apple', 'cafe\u0301', 'caf\u00e9', 'Stra\u00dfe']
+            assert list(iter_words(filename, casefold=True, normalize='NFC',
+                                   dedupe=True)) == \
+                ['apple', 'caf\u00e9', 'strasse']
+            # words stream straight into every structure
+            for algorithm in ALGORITHMS:
+                structure = autocomplete_setup(iter_words(filename), algorithm)
+                assert sorted(autocomplete('a', structure, algorithm)) == \
+                    ['apple']
+
+    def test_iter_words_falls_back_to_latin_1(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'wb') as file:
+                file.write('na\u00efve\n'.encode('latin-1') +
+                           'r\u00e9sum\u00e9\n'.encode('utf-8'))
+            assert list(iter_words(filename)) == \
+                ['na\u00efve', 'r\u00e9sum\u00e9']
+            assert get_lines(filename) == ['na\u00efve', 'r\u00e9sum\u00e9']
+
+    def test_iter_words_strips_byte_order_mark(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'wb') as file:
+                file.write('\ufeffapple\nbanana\n'.encode('utf-8'))
+            assert list(iter_words(filename)) == ['apple', 'banana']
+            structure = autocomplete_setup(iter_words(filename), 'trie')
+            assert structure.complete('a') == ['apple']
+
+    def test_iter_words_with_utf_16_encoding(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.txt')
+            with open(filename, 'wb') as file:
+                # newline bytes are two bytes wide, and \u0a0a contains 0x0a
+                file.write('axe\n\u0a0ab\ncaf\u00e9\n'.encode('utf-16-le'))
+            assert list(iter_words(filename, encoding='utf-16-le')) == \
+                ['axe', '\u0a0ab', 'caf\u00e9']
+
+
+if __name__ == '__main__':
+    unittest.main()
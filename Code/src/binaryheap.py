@@ -8,12 +8,20 @@ class BinaryMinHeap(object):
     binary tree with root node at index 0 and last leaf node at index n-1."""
 
     def __init__(self, items=None):
-        """Initialize this heap and insert the given items, if any."""
-        # Initialize an empty list to store the items
+        """Initialize this heap with the given items, if any, arranged in heap
+        order all at once by heapify instead of inserting them one by one."""
+        # Initialize a list to store the items
         self.items = []
-        if items:
-            for item in items:
-                self.insert(item)
+        if items is not None:
+            self.items = list(items)
+            self._heapify()
+
+    @classmethod
+    def from_iterable(cls, items):
+        """Return a new heap with the given items in heap order.
+        Running time: O(n) with bottom-up heapify, instead of O(n log n) for
+        inserting the n items one by one."""
+        return cls(items)
 
     def __repr__(self):
         """Return a string representation of this heap."""
@@ -21,8 +29,7 @@ class BinaryMinHeap(object):
 
     def is_empty(self):
         """Return True if this heap is empty, or False otherwise."""
-        # TODO: Check if empty based on how many items are in the list
-        # ...
+        return len(self.items) == 0
 
     def size(self):
         """Return the number of items in this heap."""
@@ -30,36 +37,38 @@ class BinaryMinHeap(object):
 
     def insert(self, item):
         """Insert the given item into this heap.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
+        Best case running time: O(1) if item is not smaller than its parent.
+        Worst case running time: O(log n) if item is smaller than the root."""
         # Insert the item at the end and bubble up to the root
-        self.items.append(item)
-        if self.size() > 1:
-            self._bubble_up(self._last_index())
+        items = self.items
+        items.append(item)
+        if len(items) > 1:
+            self._bubble_up(len(items) - 1)
 
     def get_min(self):
         """Return the minimum item at the root of this heap.
         Best and worst case running time: O(1) because min item is the root."""
-        if self.size() == 0:
+        if len(self.items) == 0:
             raise ValueError('Heap is empty and has no minimum item')
-        assert self.size() > 0
         return self.items[0]
 
     def delete_min(self):
         """Remove and return the minimum item at the root of this heap.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
-        if self.size() == 0:
+        Best case running time: O(1) if the last item is not larger than the
+        children of the root, or the heap has one item.
+        Worst case running time: O(log n) if the last item bubbles down to
+        the leaves, which is typical since it came from the leaves."""
+        items = self.items
+        if len(items) == 0:
             raise ValueError('Heap is empty and has no minimum item')
-        elif self.size() == 1:
-            # Remove and return the only item
-            return self.items.pop()
-        assert self.size() > 1
-        min_item = self.items[0]
         # Move the last item to the root and bubble down to the leaves
-        last_item = self.items.pop()
-        self.items[0] = last_item
-        if self.size() > 1:
+        last_item = items.pop()
+        if len(items) == 0:
+            # Return the only item
+            return last_item
+        min_item = items[0]
+        items[0] = last_item
+        if len(items) > 1:
             self._bubble_down(0)
         return min_item
 
@@ -67,61 +76,79 @@ class BinaryMinHeap(object):
         """Remove and return the minimum item at the root of this heap,
         and insert the given item into this heap.
         This method is more efficient than calling delete_min and then insert.
-        TODO: Best case running time: ??? under what conditions?
-        TODO: Worst case running time: ??? under what conditions?"""
-        if self.size() == 0:
+        Best case running time: O(1) if item is not larger than the children
+        of the root.
+        Worst case running time: O(log n) if item bubbles down to a leaf."""
+        items = self.items
+        if len(items) == 0:
             raise ValueError('Heap is empty and has no minimum item')
-        assert self.size() > 0
-        min_item = self.items[0]
+        min_item = items[0]
         # Replace the root and bubble down to the leaves
-        self.items[0] = item
-        if self.size() > 1:
+        items[0] = item
+        if len(items) > 1:
             self._bubble_down(0)
         return min_item
 
     def _bubble_up(self, index):
         """Ensure the heap ordering property is true above the given index,
-        swapping out of order items, or until the root node is reached.
+        moving larger parent items down into the hole left by the item at the
+        given index until the root node is reached, then placing the item in
+        the hole once instead of swapping it at every level.
         Best case running time: O(1) if parent item is smaller than this item.
         Worst case running time: O(log n) if items on path up to root node are
         out of order. Maximum path length in complete binary tree is log n."""
-        if index == 0:
-            return  # This index is the root node (does not have a parent)
-        if not (0 <= index <= self._last_index()):
+        items = self.items
+        if not (0 <= index < len(items)):
             raise IndexError('Invalid index: {}'.format(index))
-        # Get the item's value
-        item = self.items[index]
-        # Get the parent's index and value
-        parent_index = self._parent_index(index)
-        parent_item = self.items[parent_index]
-        # TODO: Swap this item with parent item if values are out of order
-        # ...
-        # TODO: Recursively bubble up again if necessary
-        # ...
+        item = items[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1  # Shift right to divide by 2
+            parent_item = items[parent_index]
+            if not item < parent_item:
+                break
+            # Move the parent item down into the hole
+            items[index] = parent_item
+            index = parent_index
+        items[index] = item
 
     def _bubble_down(self, index):
         """Ensure the heap ordering property is true below the given index,
-        swapping out of order items, or until a leaf node is reached.
+        moving smaller child items up into the hole left by the item at the
+        given index until a leaf node is reached, then placing the item in
+        the hole once instead of swapping it at every level.
         Best case running time: O(1) if item is smaller than both child items.
         Worst case running time: O(log n) if items on path down to a leaf are
         out of order. Maximum path length in complete binary tree is log n."""
-        if not (0 <= index <= self._last_index()):
+        items = self.items
+        size = len(items)
+        if not (0 <= index < size):
             raise IndexError('Invalid index: {}'.format(index))
-        # Get the index of the item's left and right children
-        left_index = self._left_child_index(index)
-        right_index = self._right_child_index(index)
-        if left_index > self._last_index():
-            return  # This index is a leaf node (does not have any children)
-        # Get the item's value
-        item = self.items[index]
-        # TODO: Determine which child item to compare this node's item to
-        child_index = 0
-        # ...
-        # TODO: Swap this item with a child item if values are out of order
-        child_item = self.items[child_index]
-        # ...
-        # TODO: Recursively bubble down again if necessary
-        # ...
+        item = items[index]
+        child_index = (index << 1) + 1  # Shift left to multiply by 2
+        while child_index < size:
+            # Compare to the smaller child item
+            right_index = child_index + 1
+            if right_index < size and items[right_index] < items[child_index]:
+                child_index = right_index
+            child_item = items[child_index]
+            if not child_item < item:
+                break
+            # Move the child item up into the hole
+            items[index] = child_item
+            index = child_index
+            child_index = (index << 1) + 1
+        items[index] = item
+
+    def _heapify(self):
+        """Arrange the items in heap order by bubbling down the item at every
+        index that has children, from the last parent back up to the root
+        (Floyd's method), so each subtree is a heap before its parent is.
+        Running time: O(n) because most items are near the leaves and bubble
+        down only a few levels: about n/4 items bubble down at most 1 level,
+        n/8 at most 2 levels, and so on, which sums to less than n levels."""
+        if len(self.items) > 1:
+            for index in range(self._parent_index(self._last_index()), -1, -1):
+                self._bubble_down(index)
 
     def _last_index(self):
         """Return the last valid index in the underlying array of items."""
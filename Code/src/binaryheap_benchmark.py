@@ -0,0 +1,149 @@
+#!python3
+
+from binaryheap import BinaryMinHeap
+import heapq
+import random
+import sys
+import time
+
+
+def best_time(function, *args, repeat=3):
+    """Return the best number of seconds taken by calling the given function
+    with the given arguments, out of the given number of repeated runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def insert_all(items):
+    """Return a new heap with the given items inserted one by one."""
+    heap = BinaryMinHeap()
+    for item in items:
+        heap.insert(item)
+    return heap
+
+
+def benchmark_construction(sizes, seed=0):
+    """Print the time to build a heap of each of the given sizes by inserting
+    items one by one and with from_iterable, for random items and for items
+    in descending order, where every insert bubbles up to the root."""
+    rng = random.Random(seed)
+    print(f'{"order":>10} {"items":>9} {"insert ms":>10} {"heapify ms":>11} '
+          f'{"speedup":>8}')
+    for size in sizes:
+        items = [rng.random() for _ in range(size)]
+        for order, ordered in [('random', items),
+                               ('descending', sorted(items, reverse=True))]:
+            inserted = best_time(insert_all, ordered)
+            heapified = best_time(BinaryMinHeap.from_iterable, ordered)
+            print(f'{order:>10} {size:>9} {inserted * 1e3:>10.1f} '
+                  f'{heapified * 1e3:>11.1f} {inserted / heapified:>7.2f}x')
+
+
+def heap_operations(heap_type, size, seed=0):
+    """Return a dict of functions that each run one workload of heap
+    operations on a heap of the given type with about the given number of
+    items: inserting random items, deleting every item, replacing the
+    minimum item with a random item as many times as there are items, and a
+    mix of two inserts for every delete, like a growing scheduling queue."""
+    rng = random.Random(seed)
+    items = [rng.random() for _ in range(size)]
+    replacements = [rng.random() for _ in range(size)]
+
+    def insert():
+        heap = heap_type()
+        for item in items:
+            heap.insert(item)
+
+    def delete_min():
+        heap = heap_type(items)
+        for _ in range(size):
+            heap.delete_min()
+
+    def replace_min():
+        heap = heap_type(items)
+        for item in replacements:
+            heap.replace_min(item)
+
+    def mixed():
+        heap = heap_type(items[:size // 2])
+        for index in range(size // 2, size, 2):
+            heap.insert(items[index])
+            heap.insert(replacements[index])
+            heap.delete_min()
+
+    return {'insert': insert, 'delete_min': delete_min,
+            'replace_min': replace_min, 'mixed': mixed}
+
+
+def heapq_operations(size, seed=0):
+    """Return a dict of functions that run the same workloads as
+    heap_operations with the heapq module, as a reference."""
+    rng = random.Random(seed)
+    items = [rng.random() for _ in range(size)]
+    replacements = [rng.random() for _ in range(size)]
+
+    def insert():
+        heap = []
+        for item in items:
+            heapq.heappush(heap, item)
+
+    def delete_min():
+        heap = list(items)
+        heapq.heapify(heap)
+        for _ in range(size):
+            heapq.heappop(heap)
+
+    def replace_min():
+        heap = list(items)
+        heapq.heapify(heap)
+        for item in replacements:
+            heapq.heapreplace(heap, item)
+
+    def mixed():
+        heap = items[:size // 2]
+        heapq.heapify(heap)
+        for index in range(size // 2, size, 2):
+            heapq.heappush(heap, items[index])
+            heapq.heappush(heap, replacements[index])
+            heapq.heappop(heap)
+
+    return {'insert': insert, 'delete_min': delete_min,
+            'replace_min': replace_min, 'mixed': mixed}
+
+
+def benchmark_operations(size, heap_types=None):
+    """Print the throughput of each workload of heap operations on heaps of
+    the given size for each heap type in the given dict of names to heap
+    types or functions that make heaps, and the time relative to heapq."""
+    if heap_types is None:
+        heap_types = {'BinaryMinHeap': BinaryMinHeap}
+    print(f'{"heap":>16} {"operation":>12} {"ops/sec":>12} {"time/heapq":>10}')
+    reference = heapq_operations(size)
+    baselines = {name: best_time(workload)
+                 for name, workload in reference.items()}
+    for heap_name, heap_type in heap_types.items():
+        operations = heap_operations(heap_type, size)
+        for name, workload in operations.items():
+            elapsed = best_time(workload)
+            print(f'{heap_name:>16} {name:>12} {size / elapsed:>12.0f} '
+                  f'{elapsed / baselines[name]:>9.1f}x')
+
+
+def main():
+    """Benchmark heaps of the given comma-separated sizes."""
+    if len(sys.argv) > 1:
+        sizes = [int(size) for size in sys.argv[1].split(',')]
+    else:
+        sizes = [1000, 10000, 100000, 1000000]
+    benchmark_construction(sizes)
+    print()
+    benchmark_operations(sizes[-1])
+
+
+if __name__ == '__main__':
+    main()
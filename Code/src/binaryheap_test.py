@@ -94,6 +94,41 @@ class TestBinaryMinHeap(unittest.TestCase):
         assert heap._parent_index(13) == 6
         assert heap._parent_index(14) == 6
 
+    def test_init_with_items(self):
+        items = [9, 25, 86, 3, 29, 5, 55]
+        heap = BinaryMinHeap(items)
+        assert heap.size() == len(items)
+        assert heap.items == [3, 9, 5, 25, 29, 86, 55]
+        # the given list is copied, not arranged in place
+        assert items == [9, 25, 86, 3, 29, 5, 55]
+        assert [heap.delete_min() for _ in items] == sorted(items)
+
+    def test_from_iterable_with_many_random_items(self):
+        for size in [0, 1, 2, 3, 50, 101]:
+            items = [random.randrange(100) for _ in range(size)]
+            heap = BinaryMinHeap.from_iterable(iter(items))
+            assert heap.size() == size
+            # every item is no smaller than its parent item
+            for index in range(1, size):
+                parent_index = heap._parent_index(index)
+                assert heap.items[parent_index] <= heap.items[index]
+            assert [heap.delete_min() for _ in items] == sorted(items)
+            assert heap.is_empty()
+
+    def test_replace_min_with_duplicate_items(self):
+        items = [5, 3, 5, 3, 8, 1, 1]
+        heap = BinaryMinHeap(items)
+        assert heap.replace_min(5) == 1
+        assert heap.replace_min(0) == 1
+        assert [heap.delete_min() for _ in items] == [0, 3, 3, 5, 5, 5, 8]
+
+    def test_bubble_invalid_index(self):
+        heap = BinaryMinHeap([1, 2, 3])
+        with self.assertRaises(IndexError):
+            heap._bubble_up(3)
+        with self.assertRaises(IndexError):
+            heap._bubble_down(-1)
+
     def test_child_index(self):
         heap = BinaryMinHeap()
         assert heap._left_child_index(0) == 1
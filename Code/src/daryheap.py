@@ -0,0 +1,122 @@
+#!python
+
+from binaryheap import BinaryMinHeap
+
+
+class DaryMinHeap(BinaryMinHeap):
+    """DaryMinHeap: a min heap where each node has up to d children instead
+    of two, with the same methods as BinaryMinHeap. Items are stored in a
+    dynamic array that implicitly represents a complete d-ary tree with root
+    node at index 0, where the children of the node at index i are at
+    indexes d*i+1 through d*i+d. A larger d makes the tree shorter (height
+    log_d n instead of log_2 n), so insert moves items up fewer levels, while
+    delete_min compares up to d children per level on fewer levels, and the
+    children compared are adjacent in the array."""
+
+    def __init__(self, items=None, d=4):
+        """Initialize this heap with the given number d of children per node
+        and the given items, if any, arranged in heap order by heapify."""
+        if d < 2:
+            raise ValueError('Heap needs at least 2 children per node: '
+                             '{}'.format(d))
+        # Number of children of each node, set before heapify needs it
+        self.d = d
+        super().__init__(items)
+
+    @classmethod
+    def from_iterable(cls, items, d=4):
+        """Return a new heap with the given number d of children per node and
+        the given items in heap order.
+        Running time: O(n) with bottom-up heapify."""
+        return cls(items, d)
+
+    def __repr__(self):
+        """Return a string representation of this heap."""
+        return 'DaryMinHeap({}, d={})'.format(self.items, self.d)
+
+    def _bubble_up(self, index):
+        """Ensure the heap ordering property is true above the given index,
+        moving larger parent items down into the hole left by the item at the
+        given index until the root node is reached.
+        Best case running time: O(1) if parent item is smaller than this item.
+        Worst case running time: O(log_d n) if items on path up to root node
+        are out of order. Maximum path length in complete d-ary tree is
+        log_d n."""
+        items = self.items
+        if not (0 <= index < len(items)):
+            raise IndexError('Invalid index: {}'.format(index))
+        d = self.d
+        item = items[index]
+        while index > 0:
+            parent_index = (index - 1) // d
+            parent_item = items[parent_index]
+            if not item < parent_item:
+                break
+            # Move the parent item down into the hole
+            items[index] = parent_item
+            index = parent_index
+        items[index] = item
+
+    def _bubble_down(self, index):
+        """Ensure the heap ordering property is true below the given index,
+        moving the smallest child items up into the hole left by the item at
+        the given index until a leaf node is reached.
+        Best case running time: O(d) if item is smaller than all child items.
+        Worst case running time: O(d log_d n) if items on path down to a leaf
+        are out of order, comparing up to d child items on each level."""
+        items = self.items
+        size = len(items)
+        if not (0 <= index < size):
+            raise IndexError('Invalid index: {}'.format(index))
+        d = self.d
+        item = items[index]
+        first_index = index * d + 1
+        while first_index < size:
+            # Find the smallest child item and its index with builtins, which
+            # scan the adjacent child items faster than a loop over indexes
+            end_index = first_index + d
+            if end_index > size:
+                end_index = size
+            child_item = min(items[first_index:end_index])
+            if not child_item < item:
+                break
+            # Move the child item up into the hole
+            child_index = items.index(child_item, first_index, end_index)
+            items[index] = child_item
+            index = child_index
+            first_index = index * d + 1
+        items[index] = item
+
+    def _parent_index(self, index):
+        """Return the parent index of the item at the given index."""
+        if index <= 0:
+            raise IndexError('Heap index {} has no parent index'.format(index))
+        return (index - 1) // self.d
+
+    def _left_child_index(self, index):
+        """Return the first (leftmost) child index of the item at the given
+        index."""
+        return index * self.d + 1
+
+    def _right_child_index(self, index):
+        """Return the last (rightmost) child index of the item at the given
+        index."""
+        return index * self.d + self.d
+
+
+def test_dary_min_heap():
+    # Create a 4-ary min heap of 7 items
+    items = [9, 25, 86, 3, 29, 5, 55]
+    heap = DaryMinHeap(items, d=4)
+    print('heap: {}'.format(heap))
+
+    print('\nDeleting items:')
+    for item in sorted(items):
+        heap_min = heap.delete_min()
+        print('delete_min: {}'.format(heap_min))
+        print('heap: {}'.format(heap))
+        print('size: {}'.format(heap.size()))
+
+
+if __name__ == '__main__':
+    test_dary_min_heap()
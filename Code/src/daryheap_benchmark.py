@@ -0,0 +1,26 @@
+#!python3
+
+from binaryheap import BinaryMinHeap
+from binaryheap_benchmark import benchmark_operations
+from daryheap import DaryMinHeap
+from functools import partial
+import sys
+
+
+def main():
+    """Benchmark d-ary heaps of the given size for the given comma-separated
+    numbers of children per node against BinaryMinHeap and heapq."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    if len(sys.argv) > 2:
+        degrees = [int(d) for d in sys.argv[2].split(',')]
+    else:
+        degrees = [2, 3, 4, 8, 16]
+    heap_types = {'BinaryMinHeap': BinaryMinHeap}
+    for d in degrees:
+        heap_types[f'DaryMinHeap(d={d})'] = partial(DaryMinHeap, d=d)
+    print(f'Heap size: {size}')
+    benchmark_operations(size, heap_types)
+
+
+if __name__ == '__main__':
+    main()
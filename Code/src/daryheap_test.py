@@ -0,0 +1,66 @@
+#!python
+
+from daryheap import DaryMinHeap
+import random
+import unittest
+
+
+class TestDaryMinHeap(unittest.TestCase):
+    def test_size_of_empty_heap(self):
+        heap = DaryMinHeap()
+        assert heap.d == 4
+        assert heap.size() == 0
+        assert heap.is_empty() is True
+        with self.assertRaises(ValueError):
+            heap.get_min()
+        with self.assertRaises(ValueError):
+            heap.delete_min()
+
+    def test_invalid_number_of_children(self):
+        with self.assertRaises(ValueError):
+            DaryMinHeap(d=1)
+
+    def test_insert_and_get_many_items(self):
+        heap = DaryMinHeap(d=3)
+        items = [9, 25, 86, 3, 29, 5, 55]
+        for index, item in enumerate(items):
+            heap.insert(item)
+            assert heap.size() == index + 1
+            assert heap.get_min() == min(items[: index + 1])
+        assert heap.items == [3, 5, 86, 9, 29, 25, 55]
+
+    def test_insert_and_delete_many_random_items(self):
+        for d in [2, 3, 4, 8]:
+            heap = DaryMinHeap(d=d)
+            items = [random.randrange(100) for _ in range(100)]
+            for item in items:
+                heap.insert(item)
+            assert [heap.delete_min() for _ in items] == sorted(items)
+            assert heap.is_empty() is True
+
+    def test_from_iterable_and_replace_min(self):
+        for d in [2, 3, 4, 8]:
+            items = [random.randrange(100) for _ in range(100)]
+            heap = DaryMinHeap.from_iterable(items, d)
+            assert heap.d == d
+            # every item is no smaller than its parent item
+            for index in range(1, len(items)):
+                assert heap.items[heap._parent_index(index)] <= \
+                    heap.items[index]
+            assert heap.replace_min(-1) == min(items)
+            assert heap.get_min() == -1
+
+    def test_parent_and_child_index(self):
+        heap = DaryMinHeap(d=4)
+        assert heap._left_child_index(0) == 1
+        assert heap._right_child_index(0) == 4
+        assert heap._left_child_index(1) == 5
+        assert heap._right_child_index(1) == 8
+        for index in range(1, 9):
+            assert heap._parent_index(index) == (0 if index <= 4 else 1)
+        with self.assertRaises(IndexError):
+            heap._parent_index(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,494 @@
+#!python3
+
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+import os
+from prefixtree import _common_prefix_length
+import struct
+import sys
+
+
+class FrozenPrefixTree(object):
+    """FrozenPrefixTree: An immutable prefix tree built in one pass from a
+    sorted list of strings and stored in flat arrays instead of node objects.
+    Nodes are numbered in level order (breadth-first) starting with the root
+    node 0, so the children of each node are numbered consecutively. Three
+    parallel buffers describe the whole tree:
+    - labels[i] is the code point of the character on the edge into node i
+    - child_start[i] is the number of node i's first child, and its children
+      are the nodes numbered child_start[i] up to child_start[i + 1]
+    - terminal[i] is 1 if node i marks the end of a string, 0 otherwise
+    Children are sorted by label, so finding a child is a binary search and
+    completions are returned in sorted order. This costs 9 bytes per node
+    instead of a PrefixTreeNode object and a dict per node."""
+
+    # Type codes of the arrays used to store labels and child start indexes
+    LABEL_TYPECODE = 'I'
+    INDEX_TYPECODE = 'I'
+
+    # Extension and header of the binary files written by save: magic bytes,
+    # a byte order mark, the number of strings and the number of nodes
+    FILE_EXTENSION = '.trie'
+    FILE_MAGIC = b'FPT1'
+    FILE_BYTE_ORDER = 0x01020304
+    FILE_HEADER = struct.Struct('=4sIII')
+
+    def __init__(self, strings=None):
+        """Initialize this frozen prefix tree with the given strings, which
+        must be sorted, or raise ValueError if they are out of order."""
+        # Node arrays grouped by depth, concatenated once all strings are read
+        level_labels = [array(FrozenPrefixTree.LABEL_TYPECODE, [0])]
+        level_counts = [array(FrozenPrefixTree.INDEX_TYPECODE, [0])]
+        level_terminal = [bytearray(1)]
+        self.size = 0
+
+        previous = None
+        for string in strings if strings is not None else ():
+            if previous is not None:
+                if string < previous:
+                    raise ValueError(f'Strings are not sorted: {previous!r} '
+                                     f'comes before {string!r}')
+                if string == previous:
+                    continue
+                depth = _common_prefix_length(previous, string)
+            else:
+                depth = 0
+            # The newest node on each level is on the previous string's path,
+            # so the new suffix hangs off the newest node at the shared depth
+            for index in range(depth, len(string)):
+                if index + 1 == len(level_labels):
+                    level_labels.append(array(FrozenPrefixTree.LABEL_TYPECODE))
+                    level_counts.append(array(FrozenPrefixTree.INDEX_TYPECODE))
+                    level_terminal.append(bytearray())
+                level_counts[index][-1] += 1
+                level_labels[index + 1].append(ord(string[index]))
+                level_counts[index + 1].append(0)
+                level_terminal[index + 1].append(0)
+            level_terminal[len(string)][-1] = 1
+            self.size += 1
+            previous = string
+
+        self.labels = array(FrozenPrefixTree.LABEL_TYPECODE)
+        self.terminal = bytearray()
+        for labels, terminal in zip(level_labels, level_terminal):
+            self.labels.extend(labels)
+            self.terminal.extend(terminal)
+        # Children are numbered right after all children of earlier nodes
+        self.child_start = array(FrozenPrefixTree.INDEX_TYPECODE, [1])
+        for counts in level_counts:
+            for count in counts:
+                self.child_start.append(self.child_start[-1] + count)
+
+    @classmethod
+    def merge(cls, trees):
+        """Return a new frozen prefix tree with all strings in the given frozen
+        prefix trees, which must not share any first character and must be
+        ordered by first character. Only the empty string may be in any tree.
+        Each tree's nodes on one level are copied as a block after the blocks
+        of earlier trees on that level, which keeps the merged nodes in level
+        order, so no tree is walked node by node."""
+        # Ranges of node numbers on each level of each tree
+        tree_levels = []
+        for tree in trees:
+            levels = []
+            start, end = 0, 1
+            while start < end:
+                levels.append((start, end))
+                start, end = tree.child_start[start], tree.child_start[end]
+            tree_levels.append(levels)
+
+        merged = cls.__new__(cls)
+        merged.size = sum(tree.size for tree in trees)
+        merged.labels = array(FrozenPrefixTree.LABEL_TYPECODE, [0])
+        merged.terminal = bytearray([any(tree.terminal[0] for tree in trees)])
+        merged.child_start = array(FrozenPrefixTree.INDEX_TYPECODE, [1])
+        # Number of the merged node where the next block's children start
+        next_start = 1 + sum(tree.child_start[1] - tree.child_start[0]
+                             for tree in trees)
+        depth = max((len(levels) for levels in tree_levels), default=0)
+        for level in range(1, depth):
+            for tree, levels in zip(trees, tree_levels):
+                if level >= len(levels):
+                    continue
+                start, end = levels[level]
+                merged.labels.extend(tree.labels[start:end])
+                merged.terminal.extend(tree.terminal[start:end])
+                offset = next_start - tree.child_start[start]
+                merged.child_start.extend(
+                    index + offset for index in tree.child_start[start:end])
+                next_start += tree.child_start[end] - tree.child_start[start]
+        merged.child_start.append(len(merged.labels))
+        return merged
+
+    @classmethod
+    def from_prefix_tree(cls, tree):
+        """Return a new frozen prefix tree with all strings in the given tree."""
+        return cls(sorted(tree.strings()))
+
+    @classmethod
+    def load(cls, filename):
+        """Return a frozen prefix tree that reads the given file written by
+        save through a read-only memory map instead of deserializing it. The
+        arrays are views of the mapped pages, so opening takes constant time
+        and processes that load the same file share one copy in the page
+        cache. Call close when done with it, or use it in a with statement."""
+        with open(filename, 'rb') as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        # views of the buffer, which must be released before it is closed
+        views = []
+        try:
+            header = FrozenPrefixTree.FILE_HEADER
+            if len(buffer) < header.size:
+                raise ValueError(f'File is too short for a prefix tree '
+                                 f'header: {filename!r}')
+            magic, byte_order, size, num_nodes = header.unpack_from(buffer)
+            if (magic != FrozenPrefixTree.FILE_MAGIC or
+                    byte_order != FrozenPrefixTree.FILE_BYTE_ORDER):
+                raise ValueError(f'Not a prefix tree file for this platform: '
+                                 f'{filename!r}')
+            label_size = array(FrozenPrefixTree.LABEL_TYPECODE).itemsize
+            index_size = array(FrozenPrefixTree.INDEX_TYPECODE).itemsize
+            expected = (header.size + num_nodes * (label_size + 1) +
+                        (num_nodes + 1) * index_size)
+            if len(buffer) != expected:
+                raise ValueError(f'File has {len(buffer)} bytes but its header '
+                                 f'needs {expected}: {filename!r}')
+
+            view = memoryview(buffer)
+            views.append(view)
+            start = header.size
+            end = start + num_nodes * label_size
+            labels = view[start:end].cast(FrozenPrefixTree.LABEL_TYPECODE)
+            views.append(labels)
+            start, end = end, end + (num_nodes + 1) * index_size
+            child_start = view[start:end].cast(FrozenPrefixTree.INDEX_TYPECODE)
+            views.append(child_start)
+            terminal = view[end:end + num_nodes]
+        except BaseException:
+            for view in reversed(views):
+                view.release()
+            buffer.close()
+            raise
+
+        tree = cls.__new__(cls)
+        tree.size = size
+        tree.labels = labels
+        tree.child_start = child_start
+        tree.terminal = terminal
+        tree._buffer = buffer
+        tree._view = view
+        return tree
+
+    def save(self, filename) -> None:
+        """Write this frozen prefix tree's arrays to the given binary file so
+        it can be reopened instantly with load."""
+        header = FrozenPrefixTree.FILE_HEADER.pack(
+            FrozenPrefixTree.FILE_MAGIC, FrozenPrefixTree.FILE_BYTE_ORDER,
+            self.size, self.num_nodes())
+        with open(filename, 'wb') as file:
+            file.write(header)
+            file.write(self.labels)
+            file.write(self.child_start)
+            file.write(self.terminal)
+
+    def close(self) -> None:
+        """Release the memory map of this frozen prefix tree, if it was
+        opened with load. It can no longer be searched afterwards."""
+        buffer = getattr(self, '_buffer', None)
+        if buffer is None:
+            return
+        for view in (self.labels, self.child_start, self.terminal, self._view):
+            view.release()
+        buffer.close()
+        self._buffer = None
+
+    def __enter__(self):
+        """Return this frozen prefix tree as the target of a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close this frozen prefix tree at the end of a with statement."""
+        self.close()
+
+    def __repr__(self):
+        """Return a string representation of this frozen prefix tree."""
+        return f'FrozenPrefixTree({self.strings()!r})'
+
+    def is_empty(self) -> bool:
+        """Return True if this frozen prefix tree contains no strings."""
+        return self.size == 0
+
+    def num_nodes(self) -> int:
+        """Return the number of nodes in this frozen prefix tree."""
+        return len(self.terminal)
+
+    def contains(self, string) -> bool:
+        """Return True if this frozen prefix tree contains the given string.
+        Time Complexity: O(l log a) for string length l and alphabet size a
+        Space Complexity: O(1)"""
+        node, depth = self._find_node(string)
+        return depth == len(string) and self.terminal[node] == 1
+
+    def complete(self, prefix) -> list:
+        """Return a list of all strings stored in this frozen prefix tree that
+        start with the given prefix string, in sorted order."""
+        node, depth = self._find_node(prefix)
+        if depth < len(prefix):
+            return []
+        completions = []
+        self._traverse(node, prefix, completions.append)
+        return completions
+
+    def complete_many(self, prefixes) -> dict:
+        """Return a dict mapping each of the given prefix strings to a list of
+        all strings stored in this frozen prefix tree that start with it.
+        Prefixes are completed in sorted order, so a prefix that extends an
+        earlier prefix comes right after it, and its completions are the run
+        of the earlier prefix's sorted completions found by binary search,
+        instead of traversing its subtree again. Other prefixes are searched
+        from the deepest node shared with the previous searched prefix."""
+        completions = {}
+        # nodes along the previous searched prefix's path, indexed by depth
+        path = [0]
+        previous = ''
+        # pairs of prefix and completions of each given prefix that is a
+        # prefix of the current one, shortest first
+        stack = []
+        for prefix in sorted(set(prefixes)):
+            while stack and not prefix.startswith(stack[-1][0]):
+                stack.pop()
+            if stack:
+                found = stack[-1][1]
+                start = bisect_left(found, prefix)
+                successor = _prefix_successor(prefix)
+                end = len(found) if successor is None else \
+                    bisect_left(found, successor, start)
+                found = found[start:end]
+            else:
+                shared = _common_prefix_length(previous, prefix)
+                del path[shared + 1:]
+                node = path[-1]
+                depth = len(path) - 1
+                while depth < len(prefix):
+                    node = self._find_child(node, prefix[depth])
+                    if node < 0:
+                        break
+                    path.append(node)
+                    depth += 1
+                found = []
+                if depth == len(prefix):
+                    self._traverse(node, prefix, found.append)
+                previous = prefix
+            completions[prefix] = found
+            stack.append((prefix, found))
+        return completions
+
+    def find_prefix_node(self, prefix, start=None) -> tuple:
+        """Return a pair containing the number of the node whose path is the
+        given prefix string and that path, or None and the prefix if no
+        string stored in this frozen prefix tree starts with it, like
+        PrefixTree.find_prefix_node. If the given start is the pair returned
+        for a shorter prefix of the given prefix, the search goes on down
+        from its node instead of starting over from the root.
+        Time Complexity: O(l log a) for the l characters of the prefix not
+        yet matched and alphabet size a
+        Space Complexity: O(1)"""
+        node, depth = 0, 0
+        if start is not None:
+            node, path = start
+            if node is None or not prefix.startswith(path):
+                return None, prefix
+            depth = len(path)
+        while depth < len(prefix):
+            node = self._find_child(node, prefix[depth])
+            if node < 0:
+                return None, prefix
+            depth += 1
+        return node, prefix
+
+    def complete_from(self, node, path) -> list:
+        """Return a list of all strings that end in the subtree below the
+        node with the given number, whose path is the given string, as
+        find_prefix_node returns them, in sorted order, or an empty list if
+        the node is None."""
+        completions = []
+        if node is not None:
+            self._traverse(node, path, completions.append)
+        return completions
+
+    def terminal_nodes(self, node=0) -> list:
+        """Return a list of the numbers of the nodes in the subtree below the
+        node with the given number that each mark the end of a string, in
+        sorted order of those strings. No strings are built, so this is
+        cheaper than complete when only the nodes are needed.
+        Time Complexity: O(n) for the n nodes in the node's subtree
+        Space Complexity: O(n) for the stack of nodes to visit"""
+        child_start = self.child_start
+        terminal = self.terminal
+        nodes = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if terminal[node]:
+                nodes.append(node)
+            # push children in reverse so they are popped in sorted order
+            stack.extend(range(child_start[node + 1] - 1,
+                               child_start[node] - 1, -1))
+        return nodes
+
+    def strings(self) -> list:
+        """Return a list of all strings stored in this frozen prefix tree, in
+        sorted order."""
+        return self.complete('')
+
+    def _find_child(self, node, character) -> int:
+        """Return the number of the given node's child whose edge label is the
+        given character, or -1 if it has no such child."""
+        code = ord(character)
+        start = self.child_start[node]
+        end = self.child_start[node + 1]
+        child = bisect_left(self.labels, code, start, end)
+        if child < end and self.labels[child] == code:
+            return child
+        return -1
+
+    def _find_node(self, string):
+        """Return a pair containing the deepest node in this frozen prefix tree
+        that matches the longest prefix of the given string and its depth."""
+        node = 0
+        depth = 0
+        for character in string:
+            child = self._find_child(node, character)
+            if child < 0:
+                break
+            node = child
+            depth += 1
+        return node, depth
+
+    def _traverse(self, node, prefix, visit) -> None:
+        """Traverse the subtree below the given node, whose path is the given
+        prefix, with an iterative depth-first traversal, and visit each string
+        that ends in this subtree with the given visit function."""
+        labels = self.labels
+        child_start = self.child_start
+        terminal = self.terminal
+        path = list(prefix)
+        if terminal[node]:
+            visit(prefix)
+        # Stack of [next child, end child] ranges of the nodes along the path
+        stack = [[child_start[node], child_start[node + 1]]]
+        while stack:
+            top = stack[-1]
+            if top[0] == top[1]:
+                stack.pop()
+                if stack:
+                    path.pop()
+                continue
+            child = top[0]
+            top[0] += 1
+            path.append(chr(labels[child]))
+            if terminal[child]:
+                visit(''.join(path))
+            stack.append([child_start[child], child_start[child + 1]])
+
+
+def _prefix_successor(prefix):
+    """Return the least string that sorts after every string that starts with
+    the given prefix string, or None if no string sorts after all of them."""
+    prefix = prefix.rstrip(chr(sys.maxunicode))
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def build_sharded(strings, max_workers=None):
+    """Return a new frozen prefix tree with the given sorted strings, built
+    in parallel by a pool of the given number of worker processes (or one per
+    CPU). The runs of strings with the same first character are found by
+    binary search and packed into about one chunk of consecutive runs per
+    worker, with about the same number of strings each, so a few large runs
+    do not leave most workers idle. Each worker builds a frozen prefix tree
+    of its chunk and sends back its flat arrays as bytes, which are cheap to
+    pickle, and the chunks are merged level by level. With one worker or one
+    chunk the tree is built in this process, without a pool."""
+    strings = strings if isinstance(strings, list) else list(strings)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # Indexes of the first string of each chunk, and the end of the last
+    bounds = [0]
+    start = 0
+    while start < len(strings):
+        first = strings[start][:1]
+        successor = _prefix_successor(first)
+        if first == '':
+            end = bisect_right(strings, '', start)
+        elif successor is None:
+            end = len(strings)
+        else:
+            end = bisect_left(strings, successor, start)
+        # unsorted strings can end a run early, the trees built check order
+        end = max(end, start + 1)
+        if end * max_workers >= len(strings) * len(bounds):
+            bounds.append(end)
+        start = end
+    if bounds[-1] < len(strings):
+        bounds.append(len(strings))
+    if len(bounds) <= 2:
+        return FrozenPrefixTree(strings)
+    for bound in bounds[1:-1]:
+        if strings[bound - 1][:1] >= strings[bound][:1]:
+            raise ValueError(f'Strings are not sorted: {strings[bound - 1]!r} '
+                             f'comes before {strings[bound]!r}')
+    chunks = [strings[start:end] for start, end in zip(bounds, bounds[1:])]
+
+    with ProcessPoolExecutor(len(chunks)) as executor:
+        results = list(executor.map(_build_shard, chunks))
+    return FrozenPrefixTree.merge([_load_shard(*result) for result in results])
+
+
+def _build_shard(strings):
+    """Return the size and the label, child start and terminal arrays as
+    bytes of a frozen prefix tree with the given sorted strings."""
+    tree = FrozenPrefixTree(strings)
+    return (tree.size, tree.labels.tobytes(), tree.child_start.tobytes(),
+            bytes(tree.terminal))
+
+
+def _load_shard(size, labels, child_start, terminal):
+    """Return a frozen prefix tree with the given size and arrays as bytes,
+    as returned by _build_shard."""
+    tree = FrozenPrefixTree.__new__(FrozenPrefixTree)
+    tree.size = size
+    tree.labels = array(FrozenPrefixTree.LABEL_TYPECODE)
+    tree.labels.frombytes(labels)
+    tree.child_start = array(FrozenPrefixTree.INDEX_TYPECODE)
+    tree.child_start.frombytes(child_start)
+    tree.terminal = bytearray(terminal)
+    return tree
+
+
+def main():
+    if len(sys.argv) == 3:
+        # Build an index file from the given vocabulary file
+        from autocomplete import iter_words
+        tree = FrozenPrefixTree(sorted(iter_words(sys.argv[1])))
+        tree.save(sys.argv[2])
+        print(f'Saved {tree.size} strings in {tree.num_nodes()} nodes '
+              f'to {sys.argv[2]}')
+        return
+
+    strings = sorted(['ABC', 'ABD', 'A', 'XYZ'])
+    tree = FrozenPrefixTree(strings)
+    print(f'tree: {tree}')
+    print(f'nodes: {tree.num_nodes()}')
+    print(f'labels: {tree.labels}')
+    print(f'child_start: {tree.child_start}')
+    print(f'terminal: {list(tree.terminal)}')
+    for prefix in ['', 'A', 'AB', 'ABC', 'X', 'Q']:
+        print(f'complete({prefix!r}): {tree.complete(prefix)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+#!python3
+
+from frozenprefixtree import FrozenPrefixTree, build_sharded
+from prefixtree import PrefixTree
+import os
+import sys
+import tempfile
+import unittest
+
+
+class FrozenPrefixTreeTest(unittest.TestCase):
+
+    def test_init_and_properties(self):
+        tree = FrozenPrefixTree()
+        assert tree.size == 0
+        assert tree.is_empty() is True
+        assert tree.num_nodes() == 1
+        assert tree.strings() == []
+        assert tree.contains('') is False
+
+    def test_init_with_sorted_strings(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        assert tree.size == 4
+        assert tree.is_empty() is False
+        # Verify nodes are numbered in level order with sorted children
+        assert list(tree.labels) == [0] + [ord(c) for c in 'AXBYCDZ']
+        assert list(tree.child_start) == [1, 3, 4, 5, 7, 8, 8, 8, 8]
+        assert list(tree.terminal) == [0, 1, 0, 0, 0, 1, 1, 1]
+
+    def test_init_with_duplicate_strings(self):
+        tree = FrozenPrefixTree(['A', 'A', 'AB', 'AB'])
+        assert tree.size == 2
+        assert tree.strings() == ['A', 'AB']
+
+    def test_init_with_unsorted_strings(self):
+        with self.assertRaises(ValueError):
+            FrozenPrefixTree(['B', 'A'])
+
+    def test_contains(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        assert tree.contains('ABC') is True
+        assert tree.contains('ABD') is True
+        assert tree.contains('A') is True
+        assert tree.contains('XYZ') is True
+        assert tree.contains('AB') is False
+        assert tree.contains('B') is False
+        assert tree.contains('XY') is False
+        assert tree.contains('XYZW') is False
+
+    def test_complete(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        assert tree.complete('ABC') == ['ABC']
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert tree.complete('A') == ['A', 'ABC', 'ABD']
+        assert tree.complete('X') == ['XYZ']
+        assert tree.complete('XA') == []
+        assert tree.complete('B') == []
+        assert tree.complete('') == ['A', 'ABC', 'ABD', 'XYZ']
+
+    def test_matches_prefix_tree(self):
+        strings = ('Shelly sells seashells by the sea shore '
+                   'Peter Piper picked a peck of pickled peppers').split()
+        tree = PrefixTree(strings)
+        frozen = FrozenPrefixTree(sorted(strings))
+        assert frozen.size == tree.size
+        assert frozen.num_nodes() == tree.num_nodes()
+        for prefix in ['', 'P', 'p', 'pe', 'pic', 's', 'se', 'sea', 'z']:
+            assert frozen.complete(prefix) == sorted(tree.complete(prefix))
+
+    def test_save_and_load(self):
+        strings = ['A', 'ABC', 'ABD', 'XYZ']
+        tree = FrozenPrefixTree.from_prefix_tree(PrefixTree(strings))
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.trie')
+            tree.save(filename)
+            with FrozenPrefixTree.load(filename) as loaded:
+                # Verify the mapped tree has the same arrays and strings
+                assert loaded.size == tree.size
+                assert list(loaded.labels) == list(tree.labels)
+                assert list(loaded.child_start) == list(tree.child_start)
+                assert list(loaded.terminal) == list(tree.terminal)
+                assert loaded.strings() == strings
+                assert loaded.complete('AB') == ['ABC', 'ABD']
+                assert loaded.contains('XYZ') is True
+                assert loaded.contains('XY') is False
+
+    def test_load_invalid_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.trie')
+            with open(filename, 'wb') as file:
+                file.write(b'not a prefix tree file')
+            with self.assertRaises(ValueError):
+                FrozenPrefixTree.load(filename)
+
+    def test_load_truncated_or_extended_file(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'words.trie')
+            tree.save(filename)
+            with open(filename, 'rb') as file:
+                data = file.read()
+            for damaged in [data[:-1], data + b'\0',
+                            data[:FrozenPrefixTree.FILE_HEADER.size]]:
+                with open(filename, 'wb') as file:
+                    file.write(damaged)
+                with self.assertRaises(ValueError):
+                    FrozenPrefixTree.load(filename)
+
+    def test_complete_many(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        prefixes = ['X', 'AB', 'A', 'ABD', 'B', 'AX', '', 'ABDE']
+        completions = tree.complete_many(prefixes)
+        assert set(completions) == set(prefixes)
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_complete_many_with_nested_prefixes(self):
+        top = chr(sys.maxunicode)
+        strings = sorted(['A', 'AB', 'ABC', 'ABD', 'AC', 'B', 'A' + top,
+                          'A' + top + 'B', top, top + top])
+        tree = FrozenPrefixTree(strings)
+        prefixes = ['', 'A', 'AB', 'ABC', 'ABCD', 'AC', 'AD', 'A' + top,
+                    'A' + top + 'B', top, top + top, 'B', 'BA']
+        completions = tree.complete_many(prefixes)
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_find_prefix_node_and_complete_from(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'XYZ'])
+        start = tree.find_prefix_node('A')
+        assert tree.complete_from(*start) == tree.complete('A')
+        # going on from a shorter prefix's node matches searching from root
+        for prefix in ['A', 'AB', 'ABC', 'ABCD', 'AX']:
+            node, path = tree.find_prefix_node(prefix, start)
+            assert (node, path) == tree.find_prefix_node(prefix)
+            assert tree.complete_from(node, path) == tree.complete(prefix)
+        assert tree.find_prefix_node('X', start) == (None, 'X')
+        assert tree.find_prefix_node('Q') == (None, 'Q')
+        assert tree.complete_from(None, 'Q') == []
+
+    def test_terminal_nodes(self):
+        tree = FrozenPrefixTree(['A', 'ABC', 'ABD', 'B', 'XYZ'])
+        nodes = tree.terminal_nodes()
+        assert len(nodes) == tree.size
+        # nodes are in sorted order of their strings
+        assert nodes == [tree.find_prefix_node(string)[0]
+                         for string in tree.strings()]
+        node, _ = tree.find_prefix_node('AB')
+        assert tree.terminal_nodes(node) == \
+            [tree.find_prefix_node('ABC')[0], tree.find_prefix_node('ABD')[0]]
+        assert FrozenPrefixTree().terminal_nodes() == []
+
+    def test_merge(self):
+        first = FrozenPrefixTree(['', 'A', 'ABC', 'ABD'])
+        second = FrozenPrefixTree(['B', 'BA'])
+        third = FrozenPrefixTree(['XYZ', 'XYZW'])
+        strings = first.strings() + second.strings() + third.strings()
+        merged = FrozenPrefixTree.merge([first, second, third])
+        expected = FrozenPrefixTree(strings)
+        # Verify merging gives the same arrays as building all at once
+        assert merged.size == expected.size
+        assert list(merged.labels) == list(expected.labels)
+        assert list(merged.child_start) == list(expected.child_start)
+        assert list(merged.terminal) == list(expected.terminal)
+        assert merged.strings() == strings
+
+    def test_build_sharded(self):
+        strings = sorted(set(('Shelly sells seashells by the sea shore '
+                              'Peter Piper picked a peck of pickled peppers '
+                              'How much wood would a wood chuck chuck').split()))
+        tree = build_sharded(strings, max_workers=2)
+        expected = FrozenPrefixTree(strings)
+        assert tree.size == expected.size
+        assert list(tree.labels) == list(expected.labels)
+        assert list(tree.child_start) == list(expected.child_start)
+        assert list(tree.terminal) == list(expected.terminal)
+        with self.assertRaises(ValueError):
+            build_sharded(['B', 'A'], max_workers=1)
+        # out of order within a chunk built by a worker
+        with self.assertRaises(ValueError):
+            build_sharded(['B', 'C', 'A'], max_workers=3)
+
+    def test_build_sharded_with_uneven_first_characters(self):
+        strings = sorted(set([''] + [f'a{index}' for index in range(50)] +
+                             ['b', 'bc', 'c', 'd', 'da', 'e']))
+        expected = FrozenPrefixTree(strings)
+        for max_workers in [1, 2, 3, 8]:
+            tree = build_sharded(iter(strings), max_workers)
+            assert tree.size == expected.size
+            assert list(tree.labels) == list(expected.labels)
+            assert list(tree.child_start) == list(expected.child_start)
+            assert list(tree.terminal) == list(expected.terminal)
+        assert build_sharded([], max_workers=2).is_empty()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#!python
+
+from binaryheap import BinaryMinHeap
+
+
+class IndexedMinHeap(BinaryMinHeap):
+    """IndexedMinHeap: a binary min heap of entries that each end with a
+    distinct key, such as (priority, key) tuples, which also keeps a dict
+    that maps each entry's key to the entry's index in the array of items.
+    Every time a sift moves an entry the dict is updated, so the entry with
+    a given key can be found in O(1) time, and changed or removed in place
+    in O(log n) time instead of searching the array or leaving stale
+    entries in the heap to be skipped later."""
+
+    def __init__(self, entries=None):
+        """Initialize this heap with the given entries, if any, arranged in
+        heap order by heapify, or raise ValueError if two have the same key."""
+        # Index of each entry's key in the array of items
+        self.positions = {}
+        super().__init__(entries)
+
+    def __repr__(self):
+        """Return a string representation of this heap."""
+        return 'IndexedMinHeap({})'.format(self.items)
+
+    def __contains__(self, key):
+        """Return True if this heap has an entry with the given key."""
+        return key in self.positions
+
+    def get(self, key):
+        """Return the entry with the given key in this heap, or raise
+        ValueError if this heap has no entry with the key.
+        Best and worst case running time: O(1) with the dict of positions."""
+        return self.items[self._position(key)]
+
+    def insert(self, entry):
+        """Insert the given entry into this heap, or raise ValueError if this
+        heap already has an entry with the same key.
+        Best case running time: O(1) if entry is not smaller than its parent.
+        Worst case running time: O(log n) if entry is smaller than the root."""
+        key = entry[-1]
+        if key in self.positions:
+            raise ValueError('Heap already has key: {!r}'.format(key))
+        self.positions[key] = len(self.items)
+        super().insert(entry)
+
+    def delete_min(self):
+        """Remove and return the minimum entry at the root of this heap.
+        Best case running time: O(1) if the heap has one entry.
+        Worst case running time: O(log n) if the last entry bubbles down to
+        the leaves."""
+        entry = super().delete_min()
+        del self.positions[entry[-1]]
+        if len(self.items) == 1:
+            # The last entry was moved to the root without bubbling down
+            self.positions[self.items[0][-1]] = 0
+        return entry
+
+    def replace_min(self, entry):
+        """Remove and return the minimum entry at the root of this heap, and
+        insert the given entry, or raise ValueError if another entry in this
+        heap has the same key as the given entry.
+        Best case running time: O(1) if entry is not larger than the children
+        of the root.
+        Worst case running time: O(log n) if entry bubbles down to a leaf."""
+        if len(self.items) == 0:
+            raise ValueError('Heap is empty and has no minimum item')
+        key = entry[-1]
+        min_key = self.items[0][-1]
+        if key in self.positions and key != min_key:
+            raise ValueError('Heap already has key: {!r}'.format(key))
+        del self.positions[min_key]
+        self.positions[key] = 0
+        return super().replace_min(entry)
+
+    def update(self, entry):
+        """Replace the entry in this heap that has the same key as the given
+        entry with it, and move it up or down to restore heap order, or raise
+        ValueError if this heap has no entry with the key.
+        Best case running time: O(1) if the entry stays in place.
+        Worst case running time: O(log n) if the entry moves to the root or
+        to a leaf."""
+        index = self._position(entry[-1])
+        old_entry = self.items[index]
+        self.items[index] = entry
+        if entry < old_entry:
+            self._bubble_up(index)
+        else:
+            self._bubble_down(index)
+
+    def remove(self, key):
+        """Remove and return the entry with the given key from this heap, or
+        raise ValueError if this heap has no entry with the key.
+        Best case running time: O(1) if the entry is the last one or the last
+        entry fits in its place.
+        Worst case running time: O(log n) if the last entry moved into its
+        place bubbles up to the root or down to a leaf."""
+        index = self._position(key)
+        items = self.items
+        del self.positions[key]
+        entry = items[index]
+        # Move the last entry into the removed entry's place
+        last_entry = items.pop()
+        if index < len(items):
+            items[index] = last_entry
+            self.positions[last_entry[-1]] = index
+            if last_entry < entry:
+                self._bubble_up(index)
+            else:
+                self._bubble_down(index)
+        return entry
+
+    def _position(self, key):
+        """Return the index of the entry with the given key in the array of
+        items, or raise ValueError if this heap has no entry with the key."""
+        try:
+            return self.positions[key]
+        except KeyError:
+            raise ValueError('Heap has no key: {!r}'.format(key)) from None
+
+    def _heapify(self):
+        """Record the position of every entry, or raise ValueError if two
+        entries have the same key, then arrange the entries in heap order."""
+        items = self.items
+        self.positions = {entry[-1]: index for index, entry in enumerate(items)}
+        if len(self.positions) != len(items):
+            raise ValueError('Heap entries must have distinct keys')
+        super()._heapify()
+
+    def _bubble_up(self, index):
+        """Ensure the heap ordering property is true above the given index,
+        moving larger parent entries down into the hole left by the entry at
+        the given index and recording the new position of each moved entry.
+        Best case running time: O(1) if parent entry is smaller than this one.
+        Worst case running time: O(log n) if entries on path up to root node
+        are out of order."""
+        items = self.items
+        positions = self.positions
+        if not (0 <= index < len(items)):
+            raise IndexError('Invalid index: {}'.format(index))
+        entry = items[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1  # Shift right to divide by 2
+            parent_entry = items[parent_index]
+            if not entry < parent_entry:
+                break
+            # Move the parent entry down into the hole
+            items[index] = parent_entry
+            positions[parent_entry[-1]] = index
+            index = parent_index
+        items[index] = entry
+        positions[entry[-1]] = index
+
+    def _bubble_down(self, index):
+        """Ensure the heap ordering property is true below the given index,
+        moving smaller child entries up into the hole left by the entry at the
+        given index and recording the new position of each moved entry.
+        Best case running time: O(1) if entry is smaller than both children.
+        Worst case running time: O(log n) if entries on path down to a leaf
+        are out of order."""
+        items = self.items
+        positions = self.positions
+        size = len(items)
+        if not (0 <= index < size):
+            raise IndexError('Invalid index: {}'.format(index))
+        entry = items[index]
+        child_index = (index << 1) + 1  # Shift left to multiply by 2
+        while child_index < size:
+            # Compare to the smaller child entry
+            right_index = child_index + 1
+            if right_index < size and items[right_index] < items[child_index]:
+                child_index = right_index
+            child_entry = items[child_index]
+            if not child_entry < entry:
+                break
+            # Move the child entry up into the hole
+            items[index] = child_entry
+            positions[child_entry[-1]] = index
+            index = child_index
+            child_index = (index << 1) + 1
+        items[index] = entry
+        positions[entry[-1]] = index
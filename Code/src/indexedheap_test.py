@@ -0,0 +1,92 @@
+#!python
+
+from indexedheap import IndexedMinHeap
+import random
+import unittest
+
+
+class TestIndexedMinHeap(unittest.TestCase):
+    def assert_positions(self, heap):
+        # every entry's key maps to its index, and every entry is no smaller
+        # than its parent entry
+        assert len(heap.positions) == heap.size()
+        for index, entry in enumerate(heap.items):
+            assert heap.positions[entry[-1]] == index
+            if index > 0:
+                assert heap.items[heap._parent_index(index)] <= entry
+
+    def test_empty_heap(self):
+        heap = IndexedMinHeap()
+        assert heap.size() == 0
+        assert 'A' not in heap
+        with self.assertRaises(ValueError):
+            heap.delete_min()
+        with self.assertRaises(ValueError):
+            heap.replace_min((1, 'A'))
+        with self.assertRaises(ValueError):
+            heap.get('A')
+        with self.assertRaises(ValueError):
+            heap.remove('A')
+        with self.assertRaises(ValueError):
+            heap.update((1, 'A'))
+
+    def test_init_with_entries(self):
+        heap = IndexedMinHeap([(9, 'A'), (3, 'B'), (5, 'C'), (1, 'D')])
+        assert heap.get_min() == (1, 'D')
+        assert heap.get('C') == (5, 'C')
+        assert 'B' in heap
+        self.assert_positions(heap)
+        with self.assertRaises(ValueError):
+            IndexedMinHeap([(1, 'A'), (2, 'A')])
+
+    def test_insert_duplicate_key(self):
+        heap = IndexedMinHeap()
+        heap.insert((2, 'A'))
+        with self.assertRaises(ValueError):
+            heap.insert((1, 'A'))
+        heap.insert((1, 'B'))
+        with self.assertRaises(ValueError):
+            heap.replace_min((3, 'A'))
+        assert heap.replace_min((3, 'B')) == (1, 'B')
+        self.assert_positions(heap)
+
+    def test_delete_min_with_two_entries(self):
+        heap = IndexedMinHeap([(2, 'B'), (1, 'A')])
+        assert heap.delete_min() == (1, 'A')
+        self.assert_positions(heap)
+        assert heap.remove('B') == (2, 'B')
+        assert heap.is_empty()
+
+    def test_random_operations(self):
+        rng = random.Random(0)
+        heap = IndexedMinHeap()
+        priorities = {}
+        for _ in range(2000):
+            operation = rng.randrange(5)
+            key = rng.randrange(50)
+            priority = rng.randrange(100)
+            if operation == 0 and key not in priorities:
+                heap.insert((priority, key))
+                priorities[key] = priority
+            elif operation == 1 and priorities:
+                priority, key = heap.delete_min()
+                assert priority == min(priorities.values())
+                del priorities[key]
+            elif operation == 2 and key in priorities:
+                heap.update((priority, key))
+                priorities[key] = priority
+            elif operation == 3 and key in priorities:
+                assert heap.remove(key) == (priorities.pop(key), key)
+            elif operation == 4 and priorities:
+                if key in priorities and key != heap.get_min()[-1]:
+                    continue
+                old_priority, old_key = heap.replace_min((priority, key))
+                del priorities[old_key]
+                priorities[key] = priority
+            self.assert_positions(heap)
+            assert sorted(heap.items) == \
+                sorted((priority, key) for key, priority in priorities.items())
+
+
+if __name__ == '__main__':
+    unittest.main()
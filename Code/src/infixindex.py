@@ -0,0 +1,112 @@
+#!python3
+
+from array import array
+from frozenprefixtree import FrozenPrefixTree
+from itertools import groupby
+from operator import itemgetter
+import sys
+import time
+
+
+class InfixIndex(object):
+    """InfixIndex: A generalized suffix index over a vocabulary of words that
+    finds every word containing a given pattern string anywhere in it.
+    Every substring of a word is a prefix of one of the word's suffixes, so
+    the distinct suffixes of all words are stored in a FrozenPrefixTree,
+    where each suffix ends at a terminal node. Two flat arrays map the
+    number of each terminal node to the indexes of the words that end with
+    its suffix: the indexes of node i's words are word_indexes[j] for j from
+    word_start[i] up to word_start[i + 1]. A search walks down the pattern's
+    path in the tree, collects the terminal nodes below it and their words,
+    so it takes time proportional to the pattern's length plus the number of
+    matches instead of scanning every word, and no suffix string is stored
+    or rebuilt outside the tree."""
+
+    def __init__(self, words=None):
+        """Initialize this infix index with the given words, if any.
+        Repeated words are stored once."""
+        # Distinct words in the order they were given
+        self.words = list(dict.fromkeys(words)) if words is not None else []
+        self.size = len(self.words)
+        # Pairs of each non-empty suffix and the index of its word, sorted
+        # by suffix, which are only held while the index is built
+        pairs = sorted((word[start:], index)
+                       for index, word in enumerate(self.words)
+                       for start in range(len(word)))
+        self.tree = FrozenPrefixTree(suffix for suffix, _ in pairs)
+        # Terminal nodes come in the same sorted order as distinct suffixes
+        node_words = []
+        suffixes = groupby(pairs, key=itemgetter(0))
+        for node, (_, group) in zip(self.tree.terminal_nodes(), suffixes):
+            node_words.extend((node, index) for _, index in group)
+        node_words.sort()
+        typecode = FrozenPrefixTree.INDEX_TYPECODE
+        self.word_indexes = array(typecode,
+                                  (index for _, index in node_words))
+        counts = [0] * (self.tree.num_nodes() + 1)
+        for node, _ in node_words:
+            counts[node + 1] += 1
+        self.word_start = array(typecode, [0])
+        for count in counts[1:]:
+            self.word_start.append(self.word_start[-1] + count)
+
+    def __repr__(self):
+        """Return a string representation of this infix index."""
+        return f'InfixIndex({self.words!r})'
+
+    def is_empty(self) -> bool:
+        """Return True if this infix index is empty (contains no words)."""
+        return self.size == 0
+
+    def search(self, pattern) -> list:
+        """Return a list of all words in this infix index that contain the
+        given pattern string, each once, ordered by the first of their
+        suffixes that starts with the pattern in sorted order.
+        Time Complexity: O(m log a + k) for pattern length m, alphabet size a
+        and k occurrences of the pattern in the words, independent of the
+        number of words
+        Space Complexity: O(k) for the matching terminal nodes and words"""
+        if pattern == '':
+            return list(self.words)
+        node, _ = self.tree.find_prefix_node(pattern)
+        if node is None:
+            return []
+        word_start = self.word_start
+        word_indexes = self.word_indexes
+        indexes = {}
+        for terminal in self.tree.terminal_nodes(node):
+            for position in range(word_start[terminal],
+                                  word_start[terminal + 1]):
+                indexes[word_indexes[position]] = None
+        return [self.words[index] for index in indexes]
+
+
+def main():
+    """Compare infix search against a linear scan of the words in the given
+    vocabulary file for the given patterns, or show a small example."""
+    if len(sys.argv) > 2:
+        from autocomplete import iter_words
+        start = time.perf_counter()
+        index = InfixIndex(iter_words(sys.argv[1]))
+        print(f'Indexed {index.size} words with {index.tree.size} '
+              f'suffixes in {time.perf_counter() - start:.3f} seconds')
+        for pattern in sys.argv[2:]:
+            start = time.perf_counter()
+            matches = index.search(pattern)
+            indexed = time.perf_counter() - start
+            start = time.perf_counter()
+            scanned = [word for word in index.words if pattern in word]
+            linear = time.perf_counter() - start
+            assert sorted(matches) == sorted(scanned)
+            print(f'{pattern!r}: {len(matches)} matches, index '
+                  f'{indexed * 1e3:.3f} ms, linear scan {linear * 1e3:.3f} ms')
+        return
+
+    index = InfixIndex(['nation', 'station', 'stationary', 'ratio', 'toad'])
+    print(f'index: {index}')
+    for pattern in ['tion', 'at', 'to', 'station', 'q', '']:
+        print(f'search({pattern!r}): {index.search(pattern)}')
+
+
+if __name__ == '__main__':
+    main()
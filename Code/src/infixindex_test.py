@@ -0,0 +1,55 @@
+#!python3
+
+from infixindex import InfixIndex
+import unittest
+
+WORDS = ['nation', 'station', 'stationary', 'ratio', 'toad', 'banana',
+         'nation']
+PATTERNS = ['tion', 'at', 'to', 'station', 'ana', 'n', 'a', 'q', 'toads', '']
+
+
+class InfixIndexTest(unittest.TestCase):
+
+    def test_init_and_properties(self):
+        index = InfixIndex()
+        assert index.size == 0
+        assert index.is_empty() is True
+        assert index.search('a') == []
+        assert index.search('') == []
+
+    def test_init_with_words(self):
+        index = InfixIndex(WORDS)
+        assert index.size == 6
+        assert index.is_empty() is False
+        assert index.words == WORDS[:6]
+        # every distinct suffix ends at a terminal node with its words
+        assert index.tree.size == len(set(word[start:] for word in WORDS
+                                          for start in range(len(word))))
+        for suffix, indexes in [('ation', [0, 1]), ('ana', [5]),
+                                ('o', [3])]:
+            node, _ = index.tree.find_prefix_node(suffix)
+            start, end = index.word_start[node], index.word_start[node + 1]
+            assert sorted(index.word_indexes[start:end]) == sorted(indexes)
+        # a node inside a suffix that is not a suffix itself has no words
+        node, _ = index.tree.find_prefix_node('tatio')
+        assert index.word_start[node] == index.word_start[node + 1]
+
+    def test_search_matches_linear_scan(self):
+        index = InfixIndex(WORDS)
+        for pattern in PATTERNS:
+            matches = index.search(pattern)
+            # each word is found once, even with many occurrences
+            assert len(matches) == len(set(matches))
+            assert sorted(matches) == \
+                sorted(set(word for word in WORDS if pattern in word))
+
+    def test_search_order(self):
+        index = InfixIndex(WORDS)
+        # words are ordered by their first matching suffix in sorted order
+        assert index.search('at') == \
+            ['ratio', 'nation', 'station', 'stationary']
+        assert index.search('') == WORDS[:6]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!python3
+
+from prefixtree import PrefixTree
+from prefixtreenode import PrefixTreeNode
+import threading
+
+
+class PersistentPrefixTree(PrefixTree):
+    """PersistentPrefixTree: A prefix tree whose nodes are never changed once
+    they are reachable from its root node, so it can be read by many threads
+    without locks while another thread writes to it. Each write copies the
+    nodes along one string's path (path copying) and shares every other
+    subtree with the previous version, then publishes the new root node with
+    a single assignment. A reader that starts an operation keeps using the
+    version of the tree it started with, and snapshot returns a prefix tree
+    fixed at the current version. Writes are serialized by a lock."""
+
+    def __init__(self, strings=None) -> object:
+        """Initialize this prefix tree and insert the given strings, if any."""
+        # Lock that serializes writers, readers never take it
+        self._lock = threading.Lock()
+        super().__init__()
+        # Pair of root node and size published by the latest write
+        self._version = (self.root, self._staged_size)
+        # Root node of the path copied by the write in progress, if any
+        self._copied_root = None
+        if strings is not None:
+            for string in strings:
+                self.insert(string)
+
+    @property
+    def size(self) -> int:
+        """Return the number of strings in the newest published version of
+        this prefix tree, which matches its published root node even while a
+        write is in progress."""
+        return self._version[1]
+
+    @size.setter
+    def size(self, size) -> None:
+        """Stage the given number of strings for the write in progress, which
+        readers see once _publish makes the write's root node visible."""
+        self._staged_size = size
+
+    @classmethod
+    def from_sorted(cls, strings) -> 'PersistentPrefixTree':
+        """Return a new prefix tree with the given sorted strings, built in
+        place since no reader can see its nodes until it is returned."""
+        tree = super().from_sorted(strings)
+        tree._publish(tree.root)
+        return tree
+
+    def snapshot(self) -> 'PersistentPrefixTree':
+        """Return a prefix tree with the strings in this prefix tree now, which
+        later writes to this prefix tree do not change. It shares all nodes
+        with this prefix tree, and writes to it are path-copied too.
+        Time Complexity: O(1)
+        Space Complexity: O(1)"""
+        root, size = self._version
+        tree = PersistentPrefixTree.__new__(PersistentPrefixTree)
+        tree._lock = threading.Lock()
+        tree.root = root
+        tree.size = size
+        tree._version = (root, size)
+        tree._copied_root = None
+        return tree
+
+    def insert(self, string, weight=None) -> None:
+        """Insert the given string into this prefix tree with the given weight
+        by copying the nodes along its path into a new version of the tree.
+        Time Complexity: O(l*b) for string length l and branching factor b
+        Space Complexity: O(l) for the copies of the nodes along its path"""
+        with self._lock:
+            path = super()._find_path(string)
+            if (path is not None and path[-1].is_terminal() and
+                    (weight is None or weight == path[-1].weight)):
+                return  # nothing would change
+
+            node = self.root.copy()
+            path = [node]
+            for character in string:
+                if node.has_child(character):
+                    child = node.get_child(character).copy()
+                    node.replace_child(character, child)
+                else:
+                    child = PrefixTreeNode(character)
+                    node.add_child(character, child)
+                node = child
+                path.append(node)
+            self._mark_terminal(path, weight)
+            self._publish(path[0])
+
+    def delete(self, string) -> None:
+        """Remove the given string from a new version of this prefix tree, or
+        raise ValueError if it is not stored."""
+        with self._lock:
+            super().delete(string)
+            self._publish(self._copied_root)
+
+    def update_weight(self, string, weight) -> None:
+        """Set the weight of the given string stored in a new version of this
+        prefix tree to the given weight, or raise ValueError if not stored."""
+        with self._lock:
+            super().update_weight(string, weight)
+            self._publish(self._copied_root)
+
+    def _find_path(self, string):
+        """Return a list of copies of the nodes along the given string's path
+        from the root node, linked to each other but not yet published, or
+        None if the whole string is not a path in this tree."""
+        path = super()._find_path(string)
+        if path is None:
+            return None
+        copies = [path[0].copy()]
+        for node in path[1:]:
+            copy = node.copy()
+            copies[-1].replace_child(node.character[0], copy)
+            copies.append(copy)
+        self._copied_root = copies[0]
+        return copies
+
+    def _publish(self, root) -> None:
+        """Make the given root node the root of this prefix tree's newest
+        version, together with the size staged by the write in progress."""
+        self._version = (root, self._staged_size)
+        self.root = root
+        self._copied_root = None
+
+
+def main():
+    tree = PersistentPrefixTree(['ABC', 'ABD', 'A'])
+    snapshot = tree.snapshot()
+    tree.insert('XYZ')
+    tree.delete('ABC')
+    print(f'tree: {tree}')
+    print(f'snapshot: {snapshot}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!python3
+
+from persistentprefixtree import PersistentPrefixTree
+import threading
+import unittest
+
+
+class PersistentPrefixTreeTest(unittest.TestCase):
+
+    def test_insert_copies_path_and_shares_subtrees(self):
+        tree = PersistentPrefixTree(['ABC', 'XYZ'])
+        root = tree.root
+        node_X = root.get_child('X')
+        node_A = root.get_child('A')
+        tree.insert('ABD')
+        # Verify a new root was published and the old version is unchanged
+        assert tree.root is not root
+        assert root.get_child('A').get_child('B').num_children() == 1
+        assert tree.root.get_child('A').get_child('B').num_children() == 2
+        assert node_A.count == 1
+        # Verify subtrees off the inserted path are shared
+        assert tree.root.get_child('X') is node_X
+        assert tree.size == 3
+        assert tree.strings() == ['ABC', 'ABD', 'XYZ']
+
+    def test_insert_existing_string_keeps_root(self):
+        tree = PersistentPrefixTree(['ABC'])
+        root = tree.root
+        tree.insert('ABC')
+        assert tree.root is root
+        tree.insert('ABC', 5)
+        assert tree.root is not root
+        assert tree.complete_top_k('A', 1) == ['ABC']
+
+    def test_snapshot_is_isolated(self):
+        tree = PersistentPrefixTree(['ABC', 'ABD', 'A'])
+        snapshot = tree.snapshot()
+        tree.insert('XYZ')
+        tree.delete('ABC')
+        tree.update_weight('A', 3)
+        # Verify the snapshot still has the strings from when it was taken
+        assert snapshot.size == 3
+        assert snapshot.strings() == ['A', 'ABC', 'ABD']
+        assert snapshot.count_completions('A') == 3
+        assert snapshot.root.max_weight == 0
+        assert tree.size == 3
+        assert tree.strings() == ['A', 'ABD', 'XYZ']
+        assert tree.count_completions('A') == 2
+        assert tree.root.max_weight == 3
+        # Verify writing to the snapshot does not change the tree
+        snapshot.insert('Q')
+        assert tree.contains('Q') is False
+        assert snapshot.contains('Q') is True
+
+    def test_delete_missing_string_keeps_root(self):
+        tree = PersistentPrefixTree(['ABC'])
+        root = tree.root
+        with self.assertRaises(ValueError):
+            tree.delete('AB')
+        with self.assertRaises(ValueError):
+            tree.update_weight('Q', 1)
+        assert tree.root is root
+        assert tree.strings() == ['ABC']
+
+    def test_size_is_published_with_root(self):
+        tree = PersistentPrefixTree(['A'])
+        seen = []
+        publish = tree._publish
+
+        def check_then_publish(root):
+            # readers still see the previous version's root and size
+            seen.append((tree.size, tree.strings()))
+            publish(root)
+
+        tree._publish = check_then_publish
+        tree.insert('B')
+        tree.delete('A')
+        tree.update_weight('B', 3)
+        assert seen == [(1, ['A']), (2, ['A', 'B']), (1, ['B'])]
+        assert tree.size == 1
+        assert tree.snapshot().size == 1
+
+    def test_from_sorted(self):
+        tree = PersistentPrefixTree.from_sorted(['A', 'ABC', 'ABD'])
+        snapshot = tree.snapshot()
+        tree.insert('AB')
+        assert snapshot.strings() == ['A', 'ABC', 'ABD']
+        assert tree.strings() == ['A', 'AB', 'ABC', 'ABD']
+        assert tree.snapshot().size == 4
+
+    def test_complete_many_reads_one_version(self):
+        tree = PersistentPrefixTree(['ABA', 'ABB', 'ABC'])
+        descend = tree._descend
+        writes = []
+
+        def write_then_descend(string, walk):
+            # a writer publishes new versions while the batch is running
+            if not writes:
+                writes.append(string)
+                tree.insert('Z')
+                tree.insert('ABD')
+            descend(string, walk)
+
+        tree._descend = write_then_descend
+        completions = tree.complete_many(['AB', 'ABD', 'Z'])
+        assert completions == {'AB': ['ABA', 'ABB', 'ABC'], 'ABD': [],
+                               'Z': []}
+        assert tree.strings() == ['ABA', 'ABB', 'ABC', 'ABD', 'Z']
+
+    def test_readers_see_consistent_versions(self):
+        tree = PersistentPrefixTree()
+        words = [f'word{number}' for number in range(300)]
+        errors = []
+
+        def read():
+            for _ in range(200):
+                snapshot = tree.snapshot()
+                completions = snapshot.complete('word')
+                if len(completions) != snapshot.size or \
+                        snapshot.count_completions('word') != snapshot.size:
+                    errors.append(len(completions))
+
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        for reader in readers:
+            reader.start()
+        for word in words:
+            tree.insert(word)
+        for reader in readers:
+            reader.join()
+        assert errors == []
+        assert tree.size == len(words)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,8 @@
 #!python3
 
-from prefixtreenode import PrefixTreeNode
-from typing import List, Tuple
+from prefixtreenode import NO_WEIGHT, PrefixTreeNode
+from priorityqueue import PriorityQueue
+from typing import Iterator, List, Tuple
 
 
 class PrefixTree(object):
@@ -30,6 +31,45 @@ class PrefixTree(object):
             for string in strings:
                 self.insert(string)
 
+    @classmethod
+    def from_sorted(cls, strings) -> 'PrefixTree':
+        """Return a new prefix tree with the given strings, which must be
+        sorted, or raise ValueError if they are out of order.
+        Instead of walking down from the root node for every string like
+        insert, this keeps the stack of nodes along the previous string's
+        path and hangs each string's new suffix off the node at the depth
+        they share, which is always a new last child since strings arrive in
+        order. Counts are summed up the stack as finished nodes are popped.
+        Time Complexity: O(n) for total length n of the new suffixes
+        Space Complexity: O(l) for the length l of the longest string"""
+        tree = cls()
+        # nodes along the previous string's path, root node first
+        path = [tree.root]
+        previous = ''
+        size = 0
+        for string in _sorted_unique(strings):
+            depth = _common_prefix_length(previous, string)
+            while len(path) > depth + 1:
+                node = path.pop()
+                path[-1].count += node.count
+            node = path[-1]
+            node.max_weight = 0
+            for character in string[depth:]:
+                child = PrefixTreeNode(character)
+                child.max_weight = 0
+                node.add_child(character, child)
+                path.append(child)
+                node = child
+            node.terminal = True
+            node.count += 1
+            size += 1
+            previous = string
+        while len(path) > 1:
+            node = path.pop()
+            path[-1].count += node.count
+        tree.size = size
+        return tree
+
     def __repr__(self):
         """Return a string representation of this prefix tree."""
         return f'PrefixTree({self.strings()!r})'
@@ -43,19 +83,44 @@ class PrefixTree(object):
 
     def contains(self, string) -> bool:
         """Return True if this prefix tree contains the given string.
-        Time Complexity:
-        Space Complexity:
+        Time Complexity: O(l) for string length l, independent of tree size
+        Space Complexity: O(1)
         """
-        # one liner via alex :)
-        return string in self.strings()
-
-    def insert(self, string) -> None:
-        """Insert the given string into this prefix tree.
+        node, depth = self._find_node(string)
+        return depth == len(string) and node.is_terminal()
+
+    def contains_many(self, strings) -> List[bool]:
+        """Return a list of booleans that are True where the given string at
+        the same index is contained in this prefix tree.
+        Strings are looked up in sorted order and each lookup resumes from the
+        deepest node shared with the previous string's path."""
+        strings = list(strings)
+        results = [False] * len(strings)
+        # pairs of depth and node along the previous string's path
+        walk = [(0, self.root)]
+        previous = ''
+        for index in sorted(range(len(strings)), key=strings.__getitem__):
+            string = strings[index]
+            shared = _common_prefix_length(previous, string)
+            while walk[-1][0] > shared:
+                walk.pop()
+            self._descend(string, walk)
+            depth, node = walk[-1]
+            results[index] = depth == len(string) and node.is_terminal()
+            previous = string
+        return results
+
+    def insert(self, string, weight=None) -> None:
+        """Insert the given string into this prefix tree with the given weight
+        used to rank completions, or keep its weight if it is already stored
+        and no weight is given. New strings have a weight of 0 by default.
         Time Complexity:
         Space Complexity:
         """
         # current
         current = self.root
+        # nodes along the string's path, to update their max weights
+        path = [current]
 
         for character in string:
 
@@ -69,10 +134,88 @@ class PrefixTree(object):
                 current.add_child(character, new_node)
                 # traverse to next node
                 current = current.get_child(character)
+            path.append(current)
 
-        if not current.is_terminal():
+        self._mark_terminal(path, weight)
+
+    def delete(self, string) -> None:
+        """Remove the given string from this prefix tree, pruning nodes that
+        no longer lead to any string, or raise ValueError if it is not stored.
+        Time Complexity: O(l*b) for string length l and branching factor b
+        Space Complexity: O(l) for the nodes along the string's path
+        """
+        path = self._find_path(string)
+        if path is None or not path[-1].is_terminal():
+            raise ValueError(f'String not found: {string!r}')
+        node = path[-1]
+        node.terminal = False
+        node.weight = 0
+        self.size -= 1
+        for ancestor in path:
+            ancestor.count -= 1
+        self._prune(path)
+        self._update_max_weights(path)
+
+    def update_weight(self, string, weight) -> None:
+        """Set the weight of the given string stored in this prefix tree to
+        the given weight and recompute the max weights along its path, or
+        raise ValueError if it is not stored.
+        Time Complexity: O(l*b) for string length l and branching factor b
+        Space Complexity: O(l) for the nodes along the string's path
+        """
+        path = self._find_path(string)
+        if path is None or not path[-1].is_terminal():
+            raise ValueError(f'String not found: {string!r}')
+        path[-1].weight = weight
+        self._update_max_weights(path)
+
+    def _find_path(self, string) -> List[PrefixTreeNode]:
+        """Return a list of the nodes along the given string's path from the
+        root node, or None if the whole string is not a path in this tree."""
+        walk = [(0, self.root)]
+        self._descend(string, walk)
+        if walk[-1][0] < len(string):
+            return None
+        return [node for depth, node in walk]
+
+    def _prune(self, path) -> None:
+        """Remove the nodes at the end of the given path from the root node
+        that neither terminate a string nor have children, and remove them
+        from the path too."""
+        while len(path) > 1:
+            node = path[-1]
+            if node.is_terminal() or node.num_children() > 0:
+                break
+            path.pop()
+            path[-1].remove_child(node.character[0])
+
+    def _update_max_weights(self, path) -> None:
+        """Recompute the max weight of every node along the given path from
+        the root node, from the bottom up, using each node's own weight and
+        its children's max weights."""
+        for node in reversed(path):
+            max_weight = node.weight if node.is_terminal() else NO_WEIGHT
+            for child in node.child_nodes():
+                if max_weight < child.max_weight:
+                    max_weight = child.max_weight
+            node.max_weight = max_weight
+
+    def _mark_terminal(self, path, weight) -> None:
+        """Mark the last node on the given path from the root node as the end
+        of a string with the given weight, or keep its weight if None, and
+        raise the max weight of every node along the path to cover it.
+        A lower weight leaves the max weights above it as upper bounds."""
+        node = path[-1]
+        if not node.is_terminal():
             self.size += 1
-            current.terminal = True
+            node.terminal = True
+            for ancestor in path:
+                ancestor.count += 1
+        if weight is not None:
+            node.weight = weight
+        for ancestor in path:
+            if ancestor.max_weight < node.weight:
+                ancestor.max_weight = node.weight
 
     def _find_node(self, string) -> Tuple[PrefixTreeNode, int]:
         """Return a pair containing the deepest node in this prefix tree that
@@ -96,25 +239,239 @@ class PrefixTree(object):
         # return node and index
         return node, index
 
-    def complete(self, prefix) -> list:
+    def complete(self, prefix, offset=0, limit=None) -> list:
         """Return a list of all strings stored in this prefix tree that start
-        with the given prefix string."""
+        with the given prefix string, or only the page of at most limit of
+        them after skipping the first offset of them. Skipped subtrees are
+        not walked, since each node counts the strings below it."""
 
         completions = []
 
-        # return all items if empty string
-        if prefix == '':
-            return self.strings()
-
         # traverse to base
-        node = self._find_node(prefix)
+        node, path = self._find_prefix_node(prefix)
 
-        # if not empty lawl
-        if node[0].character is not '':
-            self._traverse(node[0], prefix, completions.append)
+        # if any string starts with the prefix
+        if node is not None and offset == 0 and limit is None:
+            self._iterative_traverse(node, path, completions.append)
+        elif node is not None and (limit is None or limit > 0):
+            for string in self._iter_traverse(node, path, offset):
+                completions.append(string)
+                if len(completions) == limit:
+                    break
 
         return completions
 
+    def iter_complete(self, prefix, offset=0) -> Iterator[str]:
+        """Return a generator of all strings stored in this prefix tree that
+        start with the given prefix string, in the same order as complete,
+        after skipping the first offset of them.
+        Strings are found lazily, so stopping early skips the rest of the tree."""
+        node, path = self._find_prefix_node(prefix)
+        if node is not None:
+            yield from self._iter_traverse(node, path, offset)
+
+    def count_completions(self, prefix) -> int:
+        """Return the number of strings stored in this prefix tree that start
+        with the given prefix string.
+        Time Complexity: O(l) for prefix length l, using subtree counts
+        Space Complexity: O(1)"""
+        node, path = self._find_prefix_node(prefix)
+        if node is None:
+            return 0
+        return node.count
+
+    def iter_strings(self) -> Iterator[str]:
+        """Return a generator of all strings stored in this prefix tree, in the
+        same order as strings."""
+        return self._iter_traverse(self.root, '')
+
+    def complete_top_k(self, prefix, k) -> list:
+        """Return a list of the k highest weighted strings stored in this
+        prefix tree that start with the given prefix string, in order of
+        decreasing weight. Strings with equal weight are in traversal order,
+        the same order as complete returns them.
+        Search is best-first using each node's max weight in a priority queue,
+        so subtrees whose max weight is below the k-th result are never visited.
+        Equal weights are broken by each node's position in a depth-first
+        traversal, so with equal weights the search goes depth-first too and
+        only queues the siblings of the nodes along the paths it follows.
+        Time Complexity: O(l + k*b*log(k*b)) for prefix length l, branching
+        factor b and average string length, independent of the subtree size
+        Space Complexity: O(k*b) for the nodes and strings queued"""
+        completions = []
+        node, path = self._find_prefix_node(prefix)
+        if node is None or k <= 0:
+            return completions
+
+        # Queue pairs of a node and its path, or of None and a string, by
+        # negated weight so the heaviest comes first, then by the tuple of
+        # child positions from the prefix node, which sorts in depth-first
+        # order and puts a node's string before the strings below it
+        queue = PriorityQueue()
+        queue.enqueue((node, path, ()), (-node.max_weight, ()))
+        while not queue.is_empty() and len(completions) < k:
+            node, path, position = queue.dequeue()
+            if node is None:
+                # a string is only dequeued once nothing left can outweigh it
+                completions.append(path)
+                continue
+            if node.is_terminal():
+                queue.enqueue((None, path, position), (-node.weight, position))
+            for index, child in enumerate(node.child_nodes()):
+                child_position = position + (index,)
+                queue.enqueue((child, path + child.character, child_position),
+                              (-child.max_weight, child_position))
+        return completions
+
+    def complete_many(self, prefixes) -> dict:
+        """Return a dict mapping each of the given prefix strings to a list of
+        all strings stored in this prefix tree that start with it.
+        Prefixes are searched in sorted order and each search resumes from the
+        deepest node on the previous prefix's path that both prefixes share,
+        instead of walking down from the root node again. The root is read
+        once, so the whole batch sees one version of the tree. A prefix that
+        extends an earlier prefix comes right after it, and since the strings
+        below a node are a contiguous run of the strings below any of its
+        ancestors in traversal order, its completions are sliced out of the
+        earlier prefix's completions at an offset summed from the subtree
+        counts of the siblings before its path, instead of traversing its
+        subtree again.
+        Time Complexity: O(p*l*b + c) for p prefixes of length l, branching
+        factor b and c completions returned, plus one traversal below each
+        prefix that does not extend another given prefix"""
+        completions = {}
+        # pairs of depth and node along the previous prefix's path
+        walk = [(0, self.root)]
+        previous = ''
+        # prefix, node and completions of each given prefix that is a prefix
+        # of the current one, shortest first
+        stack = []
+        for prefix in sorted(set(prefixes)):
+            while stack and not prefix.startswith(stack[-1][0]):
+                stack.pop()
+            # back up to the deepest node shared with the previous prefix
+            shared = _common_prefix_length(previous, prefix)
+            while walk[-1][0] > shared:
+                walk.pop()
+            self._descend(prefix, walk)
+            previous = prefix
+            depth, deepest = walk[-1]
+            node, path = self._find_prefix_node(prefix, deepest, depth)
+            if node is None:
+                found = []
+            elif not stack or stack[-1][1] is None:
+                found = list(self._iter_traverse(node, path))
+            else:
+                _, ancestor, found = stack[-1]
+                if node is not ancestor:
+                    # the earlier prefix's node is on the walk, since its
+                    # whole path is a prefix of this prefix's path
+                    index = len(walk) - 1
+                    while walk[index][1] is not ancestor:
+                        index -= 1
+                    nodes = [step for _, step in walk[index:]]
+                    if node is not deepest:
+                        nodes.append(node)
+                    offset = _completion_offset(nodes)
+                    found = found[offset:offset + node.count]
+                else:
+                    # the prefix ends on the same edge as the earlier one
+                    found = list(found)
+            completions[prefix] = found
+            stack.append((prefix, node, found))
+        return completions
+
+    def complete_fuzzy(self, prefix, max_edits) -> list:
+        """Return a list of all strings stored in this prefix tree that start
+        with a string within the given number of edits (insertions, deletions
+        or substitutions of one character) of the given prefix string.
+        Each node on the search path carries the row of Levenshtein distances
+        between every prefix of the given prefix and the node's path, computed
+        from its parent's row, so subtrees are pruned as soon as every entry
+        in the row exceeds max_edits and all strings below a node are taken
+        as soon as its whole path is within max_edits of the prefix.
+        Time Complexity: O(m*l) for the m nodes visited and prefix length l
+        Space Complexity: O(h*l) for the rows along a path of height h"""
+        completions = []
+        row = list(range(len(prefix) + 1))
+        stack = [(self.root, '', row)]
+        while stack:
+            node, path, row = stack.pop()
+            if row[-1] <= max_edits:
+                # every string below this node starts with a close match
+                completions.extend(self._iter_traverse(node, path))
+                continue
+            # push children in reverse so they are popped in traversal order
+            for child in reversed(list(node.child_nodes())):
+                child_row = row
+                for character in child.character:
+                    child_row = _next_edit_distances(prefix, child_row,
+                                                     character)
+                    # stop once the path is close enough or cannot get closer
+                    close = min(child_row) <= max_edits
+                    if not close or child_row[-1] <= max_edits:
+                        break
+                if close:
+                    stack.append((child, path + child.character, child_row))
+        return completions
+
+    def find_prefix_node(self, prefix,
+                         start=None) -> Tuple[PrefixTreeNode, str]:
+        """Return a pair containing the node whose subtree holds all strings
+        that start with the given prefix string and that node's path, or None
+        and the prefix if no string stored in this prefix tree starts with it.
+        If the given start is the pair returned for a shorter prefix of the
+        given prefix, the search goes on down from its node instead of
+        starting over from the root.
+        Time Complexity: O(l) for the characters of the prefix not yet matched
+        Space Complexity: O(l) for the nodes along the rest of the path"""
+        if start is None:
+            return self._find_prefix_node(prefix)
+        node, path = start
+        if node is None or not (path.startswith(prefix) or
+                                prefix.startswith(path)):
+            return None, prefix
+        if len(path) >= len(prefix):
+            # the prefix ends on the same edge as the shorter one
+            return node, path
+        walk = [(len(path), node)]
+        self._descend(prefix, walk)
+        depth, node = walk[-1]
+        return self._find_prefix_node(prefix, node, depth)
+
+    def complete_from(self, node, path) -> list:
+        """Return a list of all strings that end in the subtree below the
+        given node, whose path is the given string, as find_prefix_node
+        returns them, or an empty list if the node is None.
+        Time Complexity: O(n) for the n nodes in the node's subtree
+        Space Complexity: O(c) for the c strings returned"""
+        completions = []
+        if node is not None:
+            self._iterative_traverse(node, path, completions.append)
+        return completions
+
+    def _descend(self, string, walk) -> None:
+        """Extend the given list of pairs of depth and node, which ends with a
+        node on the given string's path, with the nodes further down that path
+        until the string ends or no child matches its next character."""
+        depth, node = walk[-1]
+        while depth < len(string) and node.has_child(string[depth]):
+            node = node.get_child(string[depth])
+            depth += 1
+            walk.append((depth, node))
+
+    def _find_prefix_node(self, prefix, node=None,
+                          depth=0) -> Tuple[PrefixTreeNode, str]:
+        """Return a pair containing the node whose subtree holds all strings
+        that start with the given prefix string and that node's path, or None
+        and the prefix if no string stored in this prefix tree starts with it.
+        The given node and depth, if any, are what _find_node returns."""
+        if node is None:
+            node, depth = self._find_node(prefix)
+        if depth < len(prefix):
+            return None, prefix
+        return node, prefix
+
     def strings(self) -> list:
         """Return a list of all strings stored in this prefix tree.
         Time Complexity: O(logn) The tree is already balanced
@@ -123,10 +480,22 @@ class PrefixTree(object):
         strings = []
 
         # add all the strings using our traverses
-        self._traverse(self.root, '', strings.append)
+        self._iterative_traverse(self.root, '', strings.append)
         # return all combos
         return strings
 
+    def num_nodes(self) -> int:
+        """Return the number of nodes in this prefix tree, including the root.
+        Time Complexity: O(n) where n is the number of nodes
+        Space Complexity: O(n) for the stack of nodes to visit"""
+        count = 0
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.child_nodes())
+        return count
+
     def _traverse(self, node, prefix, visit) -> None:
         """Traverse this prefix tree with recursive depth-first traversal.
         Start at the given node with the given prefix representing its path in
@@ -140,21 +509,115 @@ class PrefixTree(object):
             visit(prefix)
 
         # continue to check
-        for char in node.children.keys():
-            # traverse to the next node and build string recursivly
-            child = node.get_child(char)
-            string = self._traverse(child, prefix + char, visit)
+        for child in node.child_nodes():
+            # traverse to the next node and build string recursivly using the
+            # child's own character so multi-character edge labels also work
+            self._traverse(child, prefix + child.character, visit)
 
-    def _iterative_traverse(self, node, prefix, visit):
-        """Traverse this prefix tree with recursive depth-first traversal.
+    def _iterative_traverse(self, node, prefix, visit) -> None:
+        """Traverse this prefix tree with iterative depth-first traversal.
         Start at the given node with the given prefix representing its path in
         this prefix tree and visit each node with the given visit function.
-        Time Complexity: 
-        Space Complexity:
+        Time Complexity: O(n) for the n nodes in the given node's subtree
+        Space Complexity: O(h) for the stack along a path of height h
         """
-        # iterativley traverse through tree
-        # todo Alan will owe me $50
-        pass
+        for string in self._iter_traverse(node, prefix):
+            visit(string)
+
+    def _iter_traverse(self, node, prefix, skip=0) -> Iterator[str]:
+        """Return a generator of the strings that end in the subtree below
+        the given node, whose path in this prefix tree is the given prefix,
+        in the same depth-first order as _traverse, after skipping the given
+        number of strings. An explicit stack replaces recursion, so long
+        strings cannot hit Python's recursion limit, strings are only joined
+        from the path's characters at terminal nodes, and subtrees with fewer
+        strings than are left to skip are skipped whole using their counts."""
+        if skip >= node.count:
+            return
+        if node.is_terminal():
+            if skip > 0:
+                skip -= 1
+            else:
+                yield prefix
+        # characters along the path and iterators over each node's children
+        path = [prefix]
+        stack = [iter(node.child_nodes())]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                # done with this node's children, back up one level
+                stack.pop()
+                path.pop()
+                continue
+            if skip >= child.count:
+                # skip every string below this child without visiting them
+                skip -= child.count
+                continue
+            path.append(child.character)
+            if child.is_terminal():
+                if skip > 0:
+                    skip -= 1
+                else:
+                    yield ''.join(path)
+            stack.append(iter(child.child_nodes()))
+
+
+def _completion_offset(nodes) -> int:
+    """Return the index of the first string below the last of the given
+    nodes, each a child of the one before it, among the strings below the
+    first node in traversal order: every terminal node along the path and
+    every string below the siblings before the path come before it."""
+    offset = 0
+    for parent, child in zip(nodes, nodes[1:]):
+        if parent.is_terminal():
+            offset += 1
+        for sibling in parent.child_nodes():
+            if sibling is child:
+                break
+            offset += sibling.count
+    return offset
+
+
+def _sorted_unique(strings) -> Iterator[str]:
+    """Return a generator of the given sorted strings without repeats, which
+    raises ValueError when a string comes before the one preceding it."""
+    previous = None
+    for string in strings:
+        if previous is not None:
+            if string < previous:
+                raise ValueError(f'Strings are not sorted: {previous!r} '
+                                 f'comes before {string!r}')
+            if string == previous:
+                continue
+        yield string
+        previous = string
+
+
+def _common_prefix_length(first, second) -> int:
+    """Return the number of leading characters shared by the given strings."""
+    length = min(len(first), len(second))
+    index = 0
+    while index < length and first[index] == second[index]:
+        index += 1
+    return index
+
+
+def _next_edit_distances(string, row, character) -> List[int]:
+    """Return the row of edit distances between every prefix of the given
+    string and a path ending with the given character, from the given row of
+    edit distances between every prefix of the string and the path before it."""
+    distance = row[0] + 1
+    next_row = [distance]
+    for index, string_character in enumerate(string):
+        # substitute, or match for free, then try inserting or deleting
+        substitute = row[index] + (string_character != character)
+        if distance + 1 < substitute:
+            substitute = distance + 1
+        distance = row[index + 1] + 1
+        if substitute < distance:
+            distance = substitute
+        next_row.append(distance)
+    return next_row
 
 
 def create_prefix_tree(strings):
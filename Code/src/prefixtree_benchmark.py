@@ -0,0 +1,178 @@
+#!python3
+
+from autocomplete import generate_prefixes, get_lines
+from autocomplete_benchmark import generate_vocabulary
+from frozenprefixtree import FrozenPrefixTree, build_sharded
+from prefixtree import PrefixTree
+from radixtree import RadixTree
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+
+def measure_memory(vocabulary, tree_type=PrefixTree):
+    """Return a pair of the number of nodes and the number of bytes allocated
+    to build a prefix tree of the given type with the given vocabulary."""
+    tracemalloc.start()
+    try:
+        tree = tree_type(vocabulary)
+        allocated = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return tree.num_nodes(), allocated
+
+
+def time_contains(tree, strings, repeat=3):
+    """Return the best average number of nanoseconds per call to contains
+    over the given strings in the given prefix tree, out of the given number
+    of repeated runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for string in strings:
+            tree.contains(string)
+        elapsed = (time.perf_counter_ns() - start) / len(strings)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def benchmark_contains(vocabulary, sizes, num_lookups=1000):
+    """Print the cost per contains lookup in prefix trees built with the
+    first number of words of the given vocabulary for each of the given
+    sizes, for half stored and half missing strings, to show that it does
+    not grow with the size of the tree."""
+    rng = random.Random(0)
+    print(f'{"words":>9} {"contains ns":>12} {"contains_many ns":>17}')
+    for size in sizes:
+        words = vocabulary[:size]
+        tree = PrefixTree(words)
+        stored = rng.choices(words, k=num_lookups // 2)
+        missing = [word + '~' for word in stored]
+        strings = stored + missing
+        per_lookup = time_contains(tree, strings)
+        start = time.perf_counter_ns()
+        tree.contains_many(strings)
+        per_many = (time.perf_counter_ns() - start) / len(strings)
+        print(f'{size:>9} {per_lookup:>12.0f} {per_many:>17.0f}')
+
+
+def benchmark_construction(vocabulary, repeat=3):
+    """Print the best time to build a prefix tree from the given vocabulary in
+    sorted order by inserting each word, and with from_sorted. Garbage
+    collection is disabled while timing, like timeit does, since collections
+    of the growing tree take most of the time of both otherwise."""
+    words = sorted(vocabulary)
+    print(f'{"construction":>12} {"ms":>10}')
+    times = {}
+    for name, build in [('insert', PrefixTree),
+                        ('from_sorted', PrefixTree.from_sorted)]:
+        best = None
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                build(words)
+                elapsed = time.perf_counter_ns() - start
+            finally:
+                gc.enable()
+            best = elapsed if best is None else min(best, elapsed)
+        times[name] = best
+        print(f'{name:>12} {best / 1e6:>10.1f}')
+    print(f'Speedup: {times["insert"] / times["from_sorted"]:.2f}x')
+
+
+def benchmark_sharded(vocabulary, repeat=3):
+    """Print the best time to build a frozen prefix tree from the given
+    vocabulary serially and with build_sharded for a few numbers of worker
+    processes, with the number of CPUs for reference."""
+    words = sorted(set(vocabulary))
+    print(f'CPUs: {os.cpu_count()}')
+    print(f'{"workers":>8} {"ms":>10} {"speedup":>8}')
+    serial = None
+    for max_workers in [None, 2, 4, 8]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            if max_workers is None:
+                FrozenPrefixTree(words)
+            else:
+                build_sharded(words, max_workers)
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best is None else min(best, elapsed)
+        serial = best if serial is None else serial
+        name = 'serial' if max_workers is None else max_workers
+        print(f'{name:>8} {best / 1e6:>10.1f} {serial / best:>7.2f}x')
+
+
+def benchmark_complete_many(vocabulary, num_prefixes=20000, repeat=3):
+    """Print the best time to complete about the given number of prefixes of
+    words in the given vocabulary one by one with complete and all at once
+    with complete_many, in each type of prefix tree, for two sets of prefixes:
+    every prefix of a sample of the words, as typed one character at a time,
+    where most prefixes extend another prefix in the batch, and a sample of
+    the first halves of words from generate_prefixes, where few do."""
+    rng = random.Random(0)
+    typed = set()
+    for word in rng.sample(vocabulary, len(vocabulary)):
+        if len(typed) >= num_prefixes:
+            break
+        typed.update(word[:end] for end in range(1, len(word) + 1))
+    generated = sorted(generate_prefixes(vocabulary))
+    generated = rng.sample(generated, min(num_prefixes, len(generated)))
+    trees = [('PrefixTree', PrefixTree(vocabulary)),
+             ('RadixTree', RadixTree(vocabulary)),
+             ('FrozenPrefixTree', FrozenPrefixTree(sorted(set(vocabulary))))]
+    print(f'{"tree":>16} {"prefixes":>10} {"count":>6} {"complete ms":>12} '
+          f'{"complete_many ms":>17} {"speedup":>8}')
+    for queries, prefixes in [('typed', sorted(typed)),
+                              ('generated', sorted(generated))]:
+        for name, tree in trees:
+            times = []
+            for complete in [lambda: {prefix: tree.complete(prefix)
+                                      for prefix in prefixes},
+                             lambda: tree.complete_many(prefixes)]:
+                best = None
+                for _ in range(repeat):
+                    start = time.perf_counter_ns()
+                    complete()
+                    elapsed = time.perf_counter_ns() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                times.append(best)
+            print(f'{name:>16} {queries:>10} {len(prefixes):>6} '
+                  f'{times[0] / 1e6:>12.1f} {times[1] / 1e6:>17.1f} '
+                  f'{times[0] / times[1]:>7.2f}x')
+
+
+def main():
+    """Benchmark prefix trees with the words in the given vocabulary file, or
+    with a synthetic vocabulary of the given number of words."""
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        vocabulary = get_lines(sys.argv[1])
+    else:
+        size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+        vocabulary = generate_vocabulary(size)
+    print(f'Vocabulary size: {len(vocabulary)}')
+
+    num_nodes, allocated = measure_memory(vocabulary)
+    print(f'Nodes: {num_nodes}')
+    print(f'Memory: {allocated / 2**20:.1f} MiB, '
+          f'{allocated / num_nodes:.1f} bytes per node')
+    print()
+
+    sizes = [size for size in [1000, 10000, 100000, 1000000]
+             if size <= len(vocabulary)]
+    benchmark_contains(vocabulary, sizes)
+    print()
+    benchmark_construction(vocabulary)
+    print()
+    benchmark_sharded(vocabulary)
+    print()
+    benchmark_complete_many(vocabulary)
+
+
+if __name__ == '__main__':
+    main()
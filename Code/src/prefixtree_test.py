@@ -1,6 +1,8 @@
 #!python3
 
 from prefixtree import PrefixTree, PrefixTreeNode
+import random
+import sys
 import unittest
 
 
@@ -245,6 +247,246 @@ class PrefixTreeTest(unittest.TestCase):
             assert len(tree_strings) == len(input_strings)  # Check length only
             self.assertCountEqual(tree_strings, input_strings)  # Ignore order
 
+    def test_insert_with_weights(self):
+        tree = PrefixTree()
+        tree.insert('ABC', 3)
+        tree.insert('ABD', 5)
+        tree.insert('A')
+        node_A = tree.root.get_child('A')
+        node_B = node_A.get_child('B')
+        # Verify terminal weights and cached subtree max weights
+        assert node_A.weight == 0
+        assert node_B.get_child('C').weight == 3
+        assert node_B.get_child('D').weight == 5
+        assert node_B.max_weight == 5
+        assert node_A.max_weight == 5
+        assert tree.root.max_weight == 5
+        # Verify inserting again without a weight keeps the weight
+        tree.insert('ABC')
+        assert node_B.get_child('C').weight == 3
+        # Verify inserting again with a weight replaces the weight
+        tree.insert('ABC', 7)
+        assert node_B.get_child('C').weight == 7
+        assert tree.root.max_weight == 7
+        assert tree.size == 3
+
+    def test_complete_top_k(self):
+        tree = PrefixTree()
+        weights = {'A': 1, 'ABC': 4, 'ABD': 9, 'ABDE': 2, 'XYZ': 6}
+        for string, weight in weights.items():
+            tree.insert(string, weight)
+        assert tree.complete_top_k('', 3) == ['ABD', 'XYZ', 'ABC']
+        assert tree.complete_top_k('A', 2) == ['ABD', 'ABC']
+        assert tree.complete_top_k('A', 10) == ['ABD', 'ABC', 'ABDE', 'A']
+        assert tree.complete_top_k('ABD', 1) == ['ABD']
+        assert tree.complete_top_k('X', 5) == ['XYZ']
+        assert tree.complete_top_k('B', 5) == []
+        assert tree.complete_top_k('A', 0) == []
+
+    def test_complete_top_k_with_equal_weights(self):
+        tree = PrefixTree(['a', 'ab', 'b'])
+        assert tree.complete_top_k('', 3) == ['a', 'ab', 'b']
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ', 'ABDE', 'XY'])
+        for prefix in ['', 'A', 'AB', 'X']:
+            for k in range(1, 8):
+                assert tree.complete_top_k(prefix, k) == \
+                    tree.complete(prefix)[:k]
+        # ties break in traversal order after weights
+        tree.insert('XY', 1)
+        assert tree.complete_top_k('', 3) == ['XY', 'A', 'ABC']
+
+    def test_complete_top_k_with_equal_weights_is_depth_first(self):
+        import prefixtree
+        letters = 'abcdefghij'
+        tree = PrefixTree(a + b + c for a in letters for b in letters
+                          for c in letters)
+        enqueued = []
+
+        class CountingQueue(prefixtree.PriorityQueue):
+            def enqueue(self, item, priority):
+                enqueued.append(item)
+                super().enqueue(item, priority)
+
+        original = prefixtree.PriorityQueue
+        prefixtree.PriorityQueue = CountingQueue
+        try:
+            assert tree.complete_top_k('a', 10) == tree.complete('a')[:10]
+        finally:
+            prefixtree.PriorityQueue = original
+        # only siblings along the followed paths are queued, not whole levels
+        assert len(enqueued) < 40
+
+    def test_iter_complete_and_iter_strings(self):
+        strings = ['ABC', 'ABD', 'A', 'XYZ']
+        tree = PrefixTree(strings)
+        # Verify generators yield the same strings in the same order
+        assert list(tree.iter_strings()) == tree.strings()
+        for prefix in ['', 'A', 'AB', 'ABC', 'X', 'XY', 'B', 'AX']:
+            assert list(tree.iter_complete(prefix)) == tree.complete(prefix)
+        # Verify generators can be stopped early
+        completions = tree.iter_complete('A')
+        assert next(completions) == 'A'
+        assert next(completions) == 'ABC'
+
+    def test_strings_longer_than_recursion_limit(self):
+        string = 'A' * (sys.getrecursionlimit() + 100)
+        tree = PrefixTree([string, string + 'B'])
+        assert tree.strings() == [string, string + 'B']
+        assert tree.complete(string + 'B') == [string + 'B']
+
+    def test_complete_many(self):
+        strings = ['ABC', 'ABD', 'A', 'XYZ']
+        tree = PrefixTree(strings)
+        prefixes = ['X', 'AB', 'A', 'ABD', 'B', 'AX', '', 'AB']
+        completions = tree.complete_many(prefixes)
+        assert set(completions) == set(prefixes)
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_complete_many_with_nested_prefixes(self):
+        rng = random.Random(0)
+        strings = [''.join(rng.choice('ABC') for _ in range(rng.randint(0, 6)))
+                   for _ in range(200)]
+        tree = PrefixTree(strings)
+        # every prefix of some strings, and of some strings not stored
+        prefixes = set()
+        for string in rng.sample(strings, 20) + ['ABCA', 'CCCCCCC', 'AD']:
+            prefixes.update(string[:end] for end in range(len(string) + 1))
+        completions = tree.complete_many(prefixes)
+        assert set(completions) == prefixes
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_find_prefix_node_and_complete_from(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        start = tree.find_prefix_node('A')
+        assert tree.complete_from(*start) == tree.complete('A')
+        # going on from a shorter prefix's node matches searching from root
+        for prefix in ['A', 'AB', 'ABC', 'ABCD', 'AX']:
+            node, path = tree.find_prefix_node(prefix, start)
+            assert (node, path) == tree.find_prefix_node(prefix)
+            assert tree.complete_from(node, path) == tree.complete(prefix)
+        assert tree.find_prefix_node('X', start) == (None, 'X')
+        assert tree.complete_from(None, 'Q') == []
+
+    def test_complete_fuzzy(self):
+        strings = ['ABC', 'ABD', 'A', 'XYZ', 'AXYZ']
+        tree = PrefixTree(strings)
+        # Verify no edits gives the same completions as complete
+        for prefix in ['', 'A', 'AB', 'ABC', 'X', 'B', 'AX']:
+            assert tree.complete_fuzzy(prefix, 0) == tree.complete(prefix)
+        # Verify substitution, insertion and deletion typos are corrected
+        assert tree.complete_fuzzy('XBZ', 1) == ['XYZ']
+        assert tree.complete_fuzzy('ABXC', 1) == ['ABC']
+        assert tree.complete_fuzzy('AYZ', 1) == ['AXYZ', 'XYZ']
+        assert tree.complete_fuzzy('QQ', 1) == []
+        self.assertCountEqual(tree.complete_fuzzy('QQ', 2), strings)
+
+    def test_delete(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        # Verify deleting a leaf string prunes only its own node
+        tree.delete('ABC')
+        assert tree.size == 3
+        assert tree.contains('ABC') is False
+        node_B = tree.root.get_child('A').get_child('B')
+        assert node_B.has_child('C') is False
+        assert node_B.has_child('D') is True
+        # Verify deleting an inner string keeps the nodes below it
+        tree.delete('A')
+        assert tree.size == 2
+        assert tree.root.get_child('A').is_terminal() is False
+        assert tree.complete('A') == ['ABD']
+        # Verify deleting the last string below a node prunes the whole branch
+        tree.delete('ABD')
+        assert tree.root.has_child('A') is False
+        assert tree.strings() == ['XYZ']
+        tree.delete('XYZ')
+        assert tree.is_empty() is True
+        assert tree.num_nodes() == 1
+        # Verify deleting strings that are not stored raises error
+        with self.assertRaises(ValueError):
+            tree.delete('XYZ')
+        tree.insert('ABC')
+        with self.assertRaises(ValueError):
+            tree.delete('AB')
+
+    def test_delete_and_update_weight_fix_max_weights(self):
+        tree = PrefixTree()
+        weights = {'A': 1, 'ABC': 4, 'ABD': 9, 'XYZ': 6}
+        for string, weight in weights.items():
+            tree.insert(string, weight)
+        node_A = tree.root.get_child('A')
+        tree.delete('ABD')
+        assert node_A.max_weight == 4
+        assert tree.root.max_weight == 6
+        tree.update_weight('A', 8)
+        assert node_A.max_weight == 8
+        assert tree.complete_top_k('', 2) == ['A', 'XYZ']
+        tree.update_weight('A', 0)
+        assert node_A.max_weight == 4
+        assert tree.complete_top_k('', 2) == ['XYZ', 'ABC']
+        with self.assertRaises(ValueError):
+            tree.update_weight('AB', 5)
+
+    def test_count_completions(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.root.count == 4
+        assert tree.count_completions('') == 4
+        assert tree.count_completions('A') == 3
+        assert tree.count_completions('AB') == 2
+        assert tree.count_completions('ABC') == 1
+        assert tree.count_completions('X') == 1
+        assert tree.count_completions('B') == 0
+        assert tree.count_completions('ABCD') == 0
+        # Verify counts are kept up to date by repeated inserts and deletes
+        tree.insert('ABC')
+        assert tree.count_completions('A') == 3
+        tree.delete('ABC')
+        assert tree.count_completions('A') == 2
+        assert tree.count_completions('AB') == 1
+        tree.delete('A')
+        assert tree.count_completions('A') == 1
+
+    def test_complete_pages(self):
+        strings = ['A', 'AB', 'ABC', 'ABD', 'AC', 'ACE', 'B', 'BA', 'XYZ']
+        tree = PrefixTree(strings)
+        for prefix in ['', 'A', 'AB', 'AC', 'B', 'Q']:
+            completions = tree.complete(prefix)
+            for offset in range(len(completions) + 2):
+                for limit in [None, 0, 1, 2, 3, 10]:
+                    end = None if limit is None else offset + limit
+                    assert tree.complete(prefix, offset, limit) == \
+                        completions[offset:end]
+                assert list(tree.iter_complete(prefix, offset)) == \
+                    completions[offset:]
+
+    def test_contains_many(self):
+        tree = PrefixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        strings = ['XYZ', 'AB', 'A', 'ABD', 'B', '', 'ABC', 'ABCD', 'A', 'XY']
+        assert tree.contains_many(strings) == \
+            [tree.contains(string) for string in strings]
+        assert tree.contains_many([]) == []
+
+    def test_from_sorted(self):
+        strings = ['', 'A', 'A', 'AB', 'ABC', 'ABD', 'B', 'BA', 'XYZ']
+        tree = PrefixTree.from_sorted(strings)
+        expected = PrefixTree(strings)
+        assert tree.size == expected.size == 8
+        assert tree.num_nodes() == expected.num_nodes()
+        assert tree.strings() == expected.strings()
+        for prefix in ['', 'A', 'AB', 'B', 'X', 'Q']:
+            assert tree.count_completions(prefix) == \
+                expected.count_completions(prefix)
+        assert tree.root.max_weight == 0
+        # the bulk-loaded tree keeps working with later writes
+        tree.insert('AA', 5)
+        tree.delete('ABC')
+        assert tree.complete_top_k('A', 1) == ['AA']
+        assert tree.complete('A') == ['A', 'AB', 'ABD', 'AA']
+        assert PrefixTree.from_sorted([]).is_empty()
+        with self.assertRaises(ValueError):
+            PrefixTree.from_sorted(['B', 'A'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,25 +1,62 @@
 #!python3
 
+from types import MappingProxyType
+
+# Max weight of a node with no strings below it, shared by all such nodes
+NO_WEIGHT = float('-inf')
+
 
 class PrefixTreeNode(object):
     """PrefixTreeNode: A node for use in a prefix tree that stores a single
     character from a string and a structure of children nodes below it, which
     associates the next character in a string to the next node along its path from
-    the tree's root node to a terminal node that marks the end of the string."""
+    the tree's root node to a terminal node that marks the end of the string.
+    Nodes use __slots__ instead of a __dict__, and most nodes have zero or one
+    child, so children are stored inline instead of in a dict of their own:
+    - no children: _keys and _nodes are both the empty tuple
+    - one child: _keys is its character and _nodes is the child node
+    - up to CHILDREN_THRESHOLD children: _keys is a tuple of characters and
+      _nodes is a tuple of the child nodes in the same order
+    - more children: _keys is a dict of characters to nodes, _nodes is None
+    Children are kept in insertion order in every representation. The
+    children property is a read-only snapshot, not the storage itself."""
 
     # Choose a type of data structure to store children nodes in
     # Hint: Choosing list or dict affects implementation of all child methods
     CHILDREN_TYPE = dict
 
+    # Number of children stored in tuples before switching to CHILDREN_TYPE
+    CHILDREN_THRESHOLD = 8
+
+    __slots__ = ('character', 'terminal', 'count', 'weight', 'max_weight',
+                 '_keys', '_nodes')
+
     def __init__(self, character=None):
         """Initialize this prefix tree node with the given character value, an
         empty structure of children nodes, and a boolean terminal property."""
         # Character that this node represents
         self.character = character
-        # Data structure to associate character keys to children node values
-        self.children = PrefixTreeNode.CHILDREN_TYPE()
+        # Inline structure to associate character keys to children nodes
+        self._keys = ()
+        self._nodes = ()
         # Marks if this node terminates a string in the prefix tree
         self.terminal = False
+        # Number of strings terminating in this node's subtree
+        self.count = 0
+        # Weight of the string this node terminates, used to rank completions
+        self.weight = 0
+        # Maximum weight of any string terminating in this node's subtree
+        self.max_weight = NO_WEIGHT
+
+    @property
+    def children(self) -> MappingProxyType:
+        """Return a read-only mapping that associates each child node's
+        character to the child node, as of when it is called. Children are
+        stored inline, so this is a view of a new dict: assigning to it or
+        deleting from it raises TypeError, and add_child, replace_child and
+        remove_child are the way to change this node's children."""
+        return MappingProxyType(
+            PrefixTreeNode.CHILDREN_TYPE(self.child_items()))
 
     def is_terminal(self) -> bool:
         """Return True if this prefix tree node terminates a string."""
@@ -27,29 +64,135 @@ class PrefixTreeNode(object):
 
     def num_children(self) -> int:
         """Return the number of children nodes this prefix tree node has."""
-        return len(self.children.keys())
+        if self._keys.__class__ is str:
+            return 1
+        return len(self._keys)
+
+    def child_nodes(self):
+        """Return an iterable of this prefix tree node's children nodes in the
+        order they were added."""
+        keys = self._keys
+        if keys.__class__ is str:
+            return (self._nodes,)
+        if keys.__class__ is tuple:
+            return self._nodes
+        return keys.values()
+
+    def child_items(self):
+        """Return an iterable of (character, child node) pairs for this prefix
+        tree node's children in the order they were added."""
+        keys = self._keys
+        if keys.__class__ is str:
+            return ((keys, self._nodes),)
+        if keys.__class__ is tuple:
+            return zip(keys, self._nodes)
+        return keys.items()
+
+    def _find_child(self, character):
+        """Return this prefix tree node's child node that represents the given
+        character, or None if it is not amongst its children."""
+        keys = self._keys
+        if keys.__class__ is str:
+            return self._nodes if keys == character else None
+        if keys.__class__ is tuple:
+            if character in keys:
+                return self._nodes[keys.index(character)]
+            return None
+        return keys.get(character)
 
     def has_child(self, character) -> bool:
         """Return True if this prefix tree node has a child node that
         represents the given character amongst its children."""
 
-        return character in self.children
+        return self._find_child(character) is not None
 
-    def get_child(self, character) -> str:
+    def get_child(self, character) -> 'PrefixTreeNode':
         """Return this prefix tree node's child node that represents the given
         character if it is amongst its children, or raise ValueError if not."""
-        if self.has_child(character):
-            return self.children[character]
+        child = self._find_child(character)
+        if child is not None:
+            return child
         else:
             raise ValueError(f'No child exists for character {character!r}')
 
     def add_child(self, character, child_node) -> None:
         """Add the given character and child node as a child of this node, or
         raise ValueError if given character is amongst this node's children."""
+        keys = self._keys
+        # check for the character in place, this is called for every new node
+        if keys == character or (keys.__class__ is not str and
+                                 character in keys):
+            raise ValueError(f'Child exists for character {character!r}')
+        if keys.__class__ is str:
+            self._keys = (keys, character)
+            self._nodes = (self._nodes, child_node)
+        elif keys.__class__ is not tuple:
+            keys[character] = child_node
+        elif len(keys) == 0:
+            self._keys = character
+            self._nodes = child_node
+        elif len(keys) < PrefixTreeNode.CHILDREN_THRESHOLD:
+            self._keys = keys + (character,)
+            self._nodes = self._nodes + (child_node,)
+        else:
+            # too many children to scan, switch to a dict
+            self._keys = PrefixTreeNode.CHILDREN_TYPE(zip(keys, self._nodes))
+            self._keys[character] = child_node
+            self._nodes = None
+
+    def replace_child(self, character, child_node) -> None:
+        """Replace this node's child that represents the given character with
+        the given child node, or raise ValueError if there is no such child."""
         if not self.has_child(character):
-            self.children[character] = child_node
+            raise ValueError(f'No child exists for character {character!r}')
+        keys = self._keys
+        if keys.__class__ is str:
+            self._nodes = child_node
+        elif keys.__class__ is tuple:
+            index = keys.index(character)
+            nodes = self._nodes
+            self._nodes = nodes[:index] + (child_node,) + nodes[index + 1:]
         else:
-            raise ValueError(f'Child exists for character {character!r}')
+            keys[character] = child_node
+
+    def remove_child(self, character) -> None:
+        """Remove this node's child that represents the given character, or
+        raise ValueError if there is no such child."""
+        if not self.has_child(character):
+            raise ValueError(f'No child exists for character {character!r}')
+        keys = self._keys
+        if keys.__class__ is str:
+            self._keys = ()
+            self._nodes = ()
+        elif keys.__class__ is tuple:
+            index = keys.index(character)
+            keys = keys[:index] + keys[index + 1:]
+            nodes = self._nodes[:index] + self._nodes[index + 1:]
+            if len(keys) == 1:
+                # back to a single inline child
+                keys, nodes = keys[0], nodes[0]
+            self._keys = keys
+            self._nodes = nodes
+        else:
+            del keys[character]
+
+    def copy(self) -> 'PrefixTreeNode':
+        """Return a new prefix tree node with the same character, weights and
+        terminal flag as this node and the same children nodes, which are
+        shared with this node, so adding, replacing or removing a child of
+        either node does not change the other node."""
+        node = PrefixTreeNode.__new__(PrefixTreeNode)
+        node.character = self.character
+        node.terminal = self.terminal
+        node.count = self.count
+        node.weight = self.weight
+        node.max_weight = self.max_weight
+        node._keys = self._keys
+        node._nodes = self._nodes
+        if self._nodes is None:
+            # only the dict representation is changed in place
+            node._keys = PrefixTreeNode.CHILDREN_TYPE(self._keys)
+        return node
 
     def __repr__(self):
         """Return a code representation of this prefix tree node."""
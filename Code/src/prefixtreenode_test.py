@@ -1,5 +1,6 @@
 #!python3
 
+from collections.abc import Mapping
 from prefixtreenode import PrefixTreeNode
 import unittest
 
@@ -13,9 +14,12 @@ class PrefixTreeNodeTest(unittest.TestCase):
         assert isinstance(node.character, str)
         assert node.character is character
         # Verify children nodes structure
-        assert isinstance(node.children, PrefixTreeNode.CHILDREN_TYPE)
+        assert isinstance(node.children, Mapping)
         assert len(node.children) == 0
         assert node.children == PrefixTreeNode.CHILDREN_TYPE()
+        # children can only be changed through the child methods
+        with self.assertRaises(TypeError):
+            node.children['B'] = PrefixTreeNode('B')
         # Verify terminal boolean
         assert isinstance(node.terminal, bool)
         assert node.terminal is False
@@ -49,3 +53,43 @@ class PrefixTreeNodeTest(unittest.TestCase):
         # Verify adding node 'C' as child to node 'A' again raises error
         with self.assertRaises(ValueError):
             node_A.add_child('C', node_C)
+
+    def test_many_children_keep_order(self):
+        node = PrefixTreeNode('A')
+        characters = 'ZYXWVUTSRQPONMLKJIHGFEDCBA'
+        children = [PrefixTreeNode(character) for character in characters]
+        for count, (character, child) in enumerate(zip(characters, children)):
+            node.add_child(character, child)
+            # Verify every child is found as children are added
+            assert node.num_children() == count + 1
+            for previous, previous_child in zip(characters, children):
+                assert node.get_child(previous) is previous_child
+                if previous == character:
+                    break
+        # Verify children are iterated in the order they were added
+        assert list(node.child_nodes()) == children
+        assert [char for char, child in node.child_items()] == list(characters)
+        assert list(node.children) == list(characters)
+        assert node.has_child('a') is False
+        assert node.has_child('') is False
+
+    def test_replace_child(self):
+        node_A = PrefixTreeNode('A')
+        with self.assertRaises(ValueError):
+            node_A.replace_child('B', PrefixTreeNode('B'))
+        for count in [1, 2, PrefixTreeNode.CHILDREN_THRESHOLD + 1]:
+            node_A = PrefixTreeNode('A')
+            for character in 'BCDEFGHIJKLMNOP'[:count]:
+                node_A.add_child(character, PrefixTreeNode(character))
+            # Verify replacing the first child keeps the others and the order
+            node_B = PrefixTreeNode('B')
+            node_A.replace_child('B', node_B)
+            assert node_A.get_child('B') is node_B
+            assert node_A.num_children() == count
+            assert list(node_A.children) == list('BCDEFGHIJKLMNOP'[:count])
+
+    def test_slots(self):
+        node = PrefixTreeNode('A')
+        # Verify nodes have no per-instance dict
+        with self.assertRaises(AttributeError):
+            node.__dict__
@@ -1,21 +1,36 @@
 #!python
 
 from binaryheap import BinaryMinHeap
+from indexedheap import IndexedMinHeap
+import itertools
 
 
 class PriorityQueue(object):
     """PriorityQueue: a partially ordered queue with methods to enqueue items
     in priority order and to access and dequeue its highest priority item.
-    Item pairs are stored in a binary min heap for its efficient operations."""
+    Items are stored in a binary min heap for its efficient operations, or in
+    any heap with the same methods given to the constructor, as entries of
+    (priority, sequence number, item) tuples. The lowest priority value is the
+    highest priority, and items with equal priority values are dequeued in
+    the order they were enqueued (first in, first out) since each entry gets
+    the next number of a counter. Sequence numbers are never equal, so
+    comparing entries never compares items, which can be any objects."""
 
-    def __init__(self):
-        """Initialize this priority queue."""
-        # Initialize new binary min heap to store items in this priority queue
-        self.heap = BinaryMinHeap()
+    def __init__(self, heap=None):
+        """Initialize this priority queue with the given empty heap to store
+        its items, such as a DaryMinHeap, or a new binary min heap if None."""
+        if heap is None:
+            # Initialize new binary min heap to store items in this queue
+            heap = BinaryMinHeap()
+        elif not heap.is_empty():
+            raise ValueError('Priority queue needs an empty heap')
+        self.heap = heap
+        # Counter of sequence numbers that order items with equal priorities
+        self.sequence = itertools.count()
 
     def __repr__(self):
         """Return a string representation of this priority queue."""
-        return 'PriorityQueue({} items, front={})'.format(self.size(), self.front())
+        return 'PriorityQueue({} items, front={})'.format(self.length(), self.front())
 
     def is_empty(self):
         """Return True if this priority queue is empty, or False otherwise."""
@@ -28,30 +43,70 @@ class PriorityQueue(object):
     def enqueue(self, item, priority):
         """Insert the given item into this priority queue in order according to
         the given priority."""
-        # TODO: Insert given item into heap in order according to given priority
-        # ...
+        # Insert given item into heap in order according to given priority
+        self.heap.insert((priority, next(self.sequence), item))
 
     def front(self):
         """Return the item at the front of this priority queue without removing
         it, or None if this priority queue is empty."""
-        if self.size() == 0:
+        if self.length() == 0:
             return None
-        # TODO: Return minimum item from heap
-        # ...
+        # Return minimum item from heap
+        return self.heap.get_min()[2]
 
     def dequeue(self):
         """Remove and return the item at the front of this priority queue,
         or raise ValueError if this priority queue is empty."""
-        if self.size() == 0:
+        if self.length() == 0:
             raise ValueError('Priority queue is empty and has no front item')
-        # TODO: Remove and return minimum item from heap
-        # ...
+        # Remove and return minimum item from heap
+        return self.heap.delete_min()[2]
 
     def push_pop(self, item, priority):
         """Remove and return the item at the front of this priority queue,
         and insert the given item in order according to the given priority.
         This method is more efficient than calling dequeue and then enqueue."""
-        if self.size() == 0:
+        if self.length() == 0:
             raise ValueError('Priority queue is empty and has no front item')
-        # TODO: Replace and return minimum item from heap
-        # ...
+        # Replace and return minimum item from heap
+        return self.heap.replace_min((priority, next(self.sequence), item))[2]
+
+
+class IndexedPriorityQueue(PriorityQueue):
+    """IndexedPriorityQueue: a priority queue of distinct items that can
+    change the priority of an item or remove an item anywhere in the queue.
+    Entries are stored in an indexed min heap that keeps the position of
+    each item, so an item is found in O(1) time and moved or removed in
+    O(log n) time, and each item has exactly one entry in the heap: enqueue
+    raises ValueError for an item that is already in the queue."""
+
+    def __init__(self):
+        """Initialize this priority queue."""
+        # Initialize new indexed min heap to store items in this queue
+        super().__init__(IndexedMinHeap())
+
+    def __repr__(self):
+        """Return a string representation of this priority queue."""
+        return 'IndexedPriorityQueue({} items, front={})'.format(
+            self.length(), self.front())
+
+    def __contains__(self, item):
+        """Return True if the given item is in this priority queue."""
+        return item in self.heap
+
+    def priority(self, item):
+        """Return the priority of the given item in this priority queue, or
+        raise ValueError if the item is not in it."""
+        return self.heap.get(item)[0]
+
+    def update_priority(self, item, priority):
+        """Change the priority of the given item in this priority queue to the
+        given priority, or raise ValueError if the item is not in it. The item
+        goes behind the items already queued with the same priority, as if it
+        was enqueued again."""
+        self.heap.update((priority, next(self.sequence), item))
+
+    def remove(self, item):
+        """Remove the given item from this priority queue, or raise ValueError
+        if the item is not in it."""
+        self.heap.remove(item)
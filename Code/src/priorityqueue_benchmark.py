@@ -0,0 +1,82 @@
+#!python3
+
+from binaryheap import BinaryMinHeap
+from binaryheap_benchmark import best_time
+from priorityqueue import PriorityQueue
+import random
+import sys
+
+
+class SlotsEntry(object):
+    """SlotsEntry: a priority queue entry record with __slots__, compared by
+    priority then sequence number, to compare against tuple entries."""
+
+    __slots__ = ('priority', 'sequence', 'item')
+
+    def __init__(self, priority, sequence, item):
+        self.priority = priority
+        self.sequence = sequence
+        self.item = item
+
+    def __lt__(self, other):
+        if self.priority != other.priority:
+            return self.priority < other.priority
+        return self.sequence < other.sequence
+
+
+def queue_entries(items, priorities):
+    """Enqueue the given items with the given priorities into a priority
+    queue, then dequeue them all."""
+    queue = PriorityQueue()
+    for item, priority in zip(items, priorities):
+        queue.enqueue(item, priority)
+    while not queue.is_empty():
+        queue.dequeue()
+
+
+def pair_entries(items, priorities):
+    """Do the same operations with (priority, item) pairs in a heap, which
+    compare items on equal priorities and are not first in, first out."""
+    heap = BinaryMinHeap()
+    for item, priority in zip(items, priorities):
+        heap.insert((priority, item))
+    while not heap.is_empty():
+        heap.delete_min()
+
+
+def slots_entries(items, priorities):
+    """Do the same operations with SlotsEntry records in a heap."""
+    heap = BinaryMinHeap()
+    for sequence, (item, priority) in enumerate(zip(items, priorities)):
+        heap.insert(SlotsEntry(priority, sequence, item))
+    while not heap.is_empty():
+        heap.delete_min()
+
+
+def benchmark_ties(size, seed=0):
+    """Print the throughput of enqueueing and dequeueing the given number of
+    items with each kind of entry, for distinct priorities and for heavy ties
+    between only a few priorities. Items are long strings with a shared
+    prefix, which are slow to compare, so pairs that compare them on ties
+    pay for it."""
+    rng = random.Random(seed)
+    items = ['item ' * 20 + str(index) for index in range(size)]
+    rng.shuffle(items)
+    print(f'{"priorities":>10} {"entries":>16} {"items/sec":>12}')
+    for distinct in [size, 16, 2]:
+        priorities = [rng.randrange(distinct) for _ in range(size)]
+        for name, function in [('(priority, seq)', queue_entries),
+                               ('(priority, item)', pair_entries),
+                               ('SlotsEntry', slots_entries)]:
+            elapsed = best_time(function, items, priorities)
+            print(f'{distinct:>10} {name:>16} {size / elapsed:>12.0f}')
+
+
+def main():
+    """Benchmark priority queues with the given number of items."""
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    benchmark_ties(size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!python
+
+from daryheap import DaryMinHeap
+from priorityqueue import IndexedPriorityQueue, PriorityQueue
+import unittest
+
+
+class TestPriorityQueue(unittest.TestCase):
+    def test_empty_queue(self):
+        queue = PriorityQueue()
+        assert queue.is_empty() is True
+        assert queue.length() == 0
+        assert queue.front() is None
+        with self.assertRaises(ValueError):
+            queue.dequeue()
+        with self.assertRaises(ValueError):
+            queue.push_pop('A', 1)
+
+    def test_enqueue_and_dequeue(self):
+        queue = PriorityQueue()
+        for item, priority in [('C', 3), ('A', 1), ('D', 4), ('B', 2)]:
+            queue.enqueue(item, priority)
+        assert queue.length() == 4
+        assert queue.front() == 'A'
+        assert queue.dequeue() == 'A'
+        assert queue.dequeue() == 'B'
+        assert queue.length() == 2
+        assert queue.dequeue() == 'C'
+        assert queue.dequeue() == 'D'
+        assert queue.is_empty() is True
+
+    def test_push_pop(self):
+        queue = PriorityQueue()
+        queue.enqueue('B', 2)
+        queue.enqueue('C', 3)
+        assert queue.push_pop('A', 1) == 'B'
+        assert queue.length() == 2
+        assert queue.dequeue() == 'A'
+        assert queue.dequeue() == 'C'
+
+    def test_equal_priorities_are_first_in_first_out(self):
+        queue = PriorityQueue()
+        # dicts cannot be compared, so only their priorities and order are
+        items = [{'name': name} for name in 'ABCDEF']
+        for index, item in enumerate(items):
+            queue.enqueue(item, index % 2)
+        assert queue.front() is items[0]
+        assert [queue.dequeue() for _ in range(3)] == \
+            [items[0], items[2], items[4]]
+        queue.enqueue(items[0], 1)
+        assert queue.push_pop(items[2], 1) is items[1]
+        assert [queue.dequeue() for _ in range(4)] == \
+            [items[3], items[5], items[0], items[2]]
+
+    def test_with_dary_heap(self):
+        heap = DaryMinHeap(d=4)
+        queue = PriorityQueue(heap)
+        assert queue.heap is heap
+        for priority, item in enumerate('JIHGFEDCBA'):
+            queue.enqueue(item, -priority)
+        assert queue.length() == 10
+        assert queue.front() == 'A'
+        assert queue.push_pop('K', 0) == 'A'
+        assert ''.join(queue.dequeue() for _ in range(10)) == 'BCDEFGHIJK'
+        with self.assertRaises(ValueError):
+            PriorityQueue(DaryMinHeap([(1, 'A')]))
+
+    def test_indexed_update_priority_and_remove(self):
+        queue = IndexedPriorityQueue()
+        for item, priority in [('C', 3), ('A', 1), ('D', 4), ('B', 2)]:
+            queue.enqueue(item, priority)
+        assert 'C' in queue
+        assert 'E' not in queue
+        with self.assertRaises(ValueError):
+            queue.enqueue('C', 0)
+        queue.update_priority('D', 0)
+        assert queue.priority('D') == 0
+        assert queue.front() == 'D'
+        queue.update_priority('A', 5)
+        queue.remove('B')
+        assert 'B' not in queue
+        with self.assertRaises(ValueError):
+            queue.remove('B')
+        with self.assertRaises(ValueError):
+            queue.update_priority('B', 1)
+        assert queue.length() == 3
+        assert queue.push_pop('B', 4) == 'D'
+        assert [queue.dequeue() for _ in range(3)] == ['C', 'B', 'A']
+        assert queue.is_empty() is True
+
+    def test_indexed_equal_priorities_are_first_in_first_out(self):
+        queue = IndexedPriorityQueue()
+        for item in 'ABCD':
+            queue.enqueue(item, 1)
+        # an updated item goes behind items with the same priority
+        queue.update_priority('A', 1)
+        queue.update_priority('D', 0)
+        assert ''.join(queue.dequeue() for _ in range(4)) == 'DBCA'
+
+
+if __name__ == '__main__':
+    unittest.main()
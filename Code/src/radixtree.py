@@ -0,0 +1,157 @@
+#!python3
+
+from prefixtree import PrefixTree, _sorted_unique
+from prefixtreenode import PrefixTreeNode
+from typing import Tuple
+
+
+class RadixTree(PrefixTree):
+    """RadixTree: A path-compressed prefix tree (aka radix tree or Patricia
+    trie) where every chain of single-child, non-terminal nodes is collapsed
+    into one node whose character attribute holds the whole edge label.
+    Children are still keyed by the first character of their edge label, so
+    each node has at most one child that can match the next character of a
+    string. This stores the same strings as a PrefixTree with far fewer nodes
+    and far fewer hops per lookup, since a single step can match many
+    characters at once."""
+
+    @classmethod
+    def from_sorted(cls, strings) -> 'RadixTree':
+        """Return a new radix tree with the given strings, which must be
+        sorted, or raise ValueError if they are out of order. A later string
+        can split the edge label of an earlier one, so each string is
+        inserted from the root node."""
+        tree = cls()
+        for string in _sorted_unique(strings):
+            tree.insert(string)
+        return tree
+
+    def insert(self, string, weight=None) -> None:
+        """Insert the given string into this radix tree with the given weight,
+        splitting an edge label where the string diverges from it.
+        Time Complexity: O(l) where l is the length of the string
+        Space Complexity: O(1) at most two new nodes are created"""
+        node = self.root
+        index = 0
+        path = [node]
+
+        while index < len(string):
+            character = string[index]
+
+            # no edge starts with this character, hang the rest off this node
+            if not node.has_child(character):
+                leaf = PrefixTreeNode(string[index:])
+                node.add_child(character, leaf)
+                node = leaf
+                path.append(node)
+                break
+
+            child = node.get_child(character)
+            label = child.character
+            matched = _label_match_length(label, string, index)
+
+            # whole edge label matched, keep descending
+            if matched == len(label):
+                node = child
+                index += matched
+                path.append(node)
+                continue
+
+            # split the edge where the string diverges from its label
+            middle = PrefixTreeNode(label[:matched])
+            middle.count = child.count
+            middle.max_weight = child.max_weight
+            child.character = label[matched:]
+            middle.add_child(child.character[0], child)
+            node.replace_child(character, middle)
+            node = middle
+            index += matched
+            path.append(node)
+
+        self._mark_terminal(path, weight)
+
+    def _find_node(self, string) -> Tuple[PrefixTreeNode, int]:
+        """Return a pair containing the deepest node in this radix tree whose
+        whole path matches a prefix of the given string and the node's depth.
+        The depth returned is the number of string characters matched, which
+        can be more than the number of nodes visited."""
+        node = self.root
+        index = 0
+
+        while index < len(string) and node.has_child(string[index]):
+            child = node.get_child(string[index])
+            label = child.character
+            # stop if this edge label is not fully matched by the string
+            if not string.startswith(label, index):
+                break
+            node = child
+            index += len(label)
+
+        return node, index
+
+    def _prune(self, path) -> None:
+        """Remove the nodes at the end of the given path from the root node
+        that no longer lead to any string, then merge the last node left on
+        the path into its child if it is not terminal and has only one child,
+        so every chain of single-child nodes stays collapsed."""
+        super()._prune(path)
+        node = path[-1]
+        if len(path) > 1 and not node.is_terminal() and node.num_children() == 1:
+            child = next(iter(node.child_nodes()))
+            child.character = node.character + child.character
+            path[-2].replace_child(node.character[0], child)
+            path[-1] = child
+
+    def _descend(self, string, walk) -> None:
+        """Extend the given list of pairs of depth and node, which ends with a
+        node on the given string's path, with the nodes further down that path
+        whose whole edge labels match the string."""
+        depth, node = walk[-1]
+        while depth < len(string) and node.has_child(string[depth]):
+            child = node.get_child(string[depth])
+            if not string.startswith(child.character, depth):
+                break
+            node = child
+            depth += len(child.character)
+            walk.append((depth, node))
+
+    def _find_prefix_node(self, prefix, node=None,
+                          depth=0) -> Tuple[PrefixTreeNode, str]:
+        """Return a pair containing the node whose subtree holds all strings
+        that start with the given prefix string and that node's path, which
+        is longer than the prefix if the prefix ends partway along an edge."""
+        if node is None:
+            node, depth = self._find_node(prefix)
+        if depth == len(prefix):
+            return node, prefix
+        # the prefix may end partway along the next edge label
+        if not node.has_child(prefix[depth]):
+            return None, prefix
+        child = node.get_child(prefix[depth])
+        path = prefix[:depth] + child.character
+        if not path.startswith(prefix):
+            return None, prefix
+        return child, path
+
+
+def _label_match_length(label, string, start) -> int:
+    """Return the number of leading characters of the given label that match
+    the given string starting at the given index."""
+    length = min(len(label), len(string) - start)
+    matched = 0
+    while matched < length and label[matched] == string[start + matched]:
+        matched += 1
+    return matched
+
+
+def main():
+    strings = ['ABC', 'ABD', 'A', 'XYZ']
+    tree = RadixTree(strings)
+    print(f'tree: {tree}')
+    print(f'nodes: {tree.num_nodes()}')
+    for prefix in ['', 'A', 'AB', 'ABC', 'X', 'XY', 'Q']:
+        print(f'complete({prefix!r}): {tree.complete(prefix)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+#!python3
+
+from prefixtree import PrefixTree
+from radixtree import RadixTree
+import random
+import unittest
+
+
+class RadixTreeTest(unittest.TestCase):
+
+    def test_insert_collapses_single_child_chains(self):
+        tree = RadixTree(['ABC'])
+        assert tree.size == 1
+        assert tree.root.num_children() == 1
+        # Verify the whole string is stored as a single edge label
+        node_ABC = tree.root.get_child('A')
+        assert node_ABC.character == 'ABC'
+        assert node_ABC.is_terminal() is True
+        assert node_ABC.num_children() == 0
+
+    def test_insert_splits_edge_labels(self):
+        tree = RadixTree()
+        tree.insert('ABC')
+        tree.insert('ABD')
+        # Verify edge 'ABC' was split into 'AB' with children 'C' and 'D'
+        node_AB = tree.root.get_child('A')
+        assert node_AB.character == 'AB'
+        assert node_AB.is_terminal() is False
+        assert node_AB.num_children() == 2
+        assert node_AB.get_child('C').character == 'C'
+        assert node_AB.get_child('D').character == 'D'
+        # Insert substring ending partway along edge 'AB'
+        tree.insert('A')
+        node_A = tree.root.get_child('A')
+        assert node_A.character == 'A'
+        assert node_A.is_terminal() is True
+        assert node_A.num_children() == 1
+        assert node_A.get_child('B') is node_AB
+        assert node_AB.character == 'B'
+        assert tree.size == 3
+
+    def test_size_with_repeated_insert(self):
+        tree = RadixTree()
+        for string in ['A', 'A', 'ABC', 'ABC', 'ABD', 'XYZ', 'XYZ']:
+            tree.insert(string)
+        assert tree.size == 4
+        assert tree.is_empty() is False
+
+    def test_contains(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.contains('ABC') is True
+        assert tree.contains('ABD') is True
+        assert tree.contains('A') is True
+        assert tree.contains('XYZ') is True
+        assert tree.contains('AB') is False
+        assert tree.contains('XY') is False
+        assert tree.contains('X') is False
+        assert tree.contains('ABCD') is False
+
+    def test_complete(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.complete('ABC') == ['ABC']
+        assert tree.complete('AB') == ['ABC', 'ABD']
+        assert tree.complete('A') == ['A', 'ABC', 'ABD']
+        assert tree.complete('XY') == ['XYZ']
+        assert tree.complete('X') == ['XYZ']
+        assert tree.complete('XYZW') == []
+        assert tree.complete('XA') == []
+        assert tree.complete('B') == []
+        self.assertCountEqual(tree.complete(''), ['ABC', 'ABD', 'A', 'XYZ'])
+
+    def test_matches_prefix_tree_with_fewer_nodes(self):
+        strings = ('How much wood would a wood chuck chuck'
+                   ' if a wood chuck could chuck wood').split()
+        trie = PrefixTree(strings)
+        radix = RadixTree(strings)
+        assert radix.size == trie.size
+        self.assertCountEqual(radix.strings(), trie.strings())
+        for prefix in ['', 'w', 'wo', 'woo', 'c', 'ch', 'chuck', 'z']:
+            self.assertCountEqual(radix.complete(prefix), trie.complete(prefix))
+        assert radix.num_nodes() < trie.num_nodes()
+        # Verify a long string is matched in far fewer hops
+        node, depth = radix._find_node('chuck')
+        assert depth == len('chuck')
+        assert node.is_terminal() is True
+
+    def test_complete_top_k_after_splits(self):
+        tree = RadixTree()
+        weights = {'ABDE': 2, 'ABD': 9, 'ABC': 4, 'A': 1, 'XYZ': 6}
+        for string, weight in weights.items():
+            tree.insert(string, weight)
+        # Verify split nodes keep the max weight of the subtree below them
+        assert tree.root.get_child('A').max_weight == 9
+        assert tree.complete_top_k('', 3) == ['ABD', 'XYZ', 'ABC']
+        assert tree.complete_top_k('AB', 2) == ['ABD', 'ABC']
+        assert tree.complete_top_k('XY', 2) == ['XYZ']
+
+    def test_complete_many(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ', 'XYW'])
+        prefixes = ['X', 'XY', 'XYZ', 'AB', 'A', 'ABD', 'B', 'AX', '', 'XYA']
+        completions = tree.complete_many(prefixes)
+        assert set(completions) == set(prefixes)
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_complete_many_with_nested_prefixes(self):
+        rng = random.Random(0)
+        strings = [''.join(rng.choice('ABC') for _ in range(rng.randint(0, 6)))
+                   for _ in range(200)]
+        tree = RadixTree(strings)
+        # every prefix of some strings, and of some strings not stored
+        prefixes = set()
+        for string in rng.sample(strings, 20) + ['ABCA', 'CCCCCCC', 'AD']:
+            prefixes.update(string[:end] for end in range(len(string) + 1))
+        completions = tree.complete_many(prefixes)
+        assert set(completions) == prefixes
+        for prefix in prefixes:
+            assert completions[prefix] == tree.complete(prefix)
+
+    def test_find_prefix_node_and_complete_from(self):
+        tree = RadixTree(['ABCDE', 'ABCDF', 'A', 'XYZ'])
+        start = tree.find_prefix_node('AB')
+        assert start[1] == 'ABCD'
+        # prefixes ending on the same edge share the shorter prefix's node
+        for prefix in ['ABC', 'ABCD', 'ABCDE', 'ABCE', 'ABCDEF']:
+            node, path = tree.find_prefix_node(prefix, start)
+            assert (node, path) == tree.find_prefix_node(prefix)
+            assert tree.complete_from(node, path) == tree.complete(prefix)
+
+    def test_complete_fuzzy(self):
+        strings = ['ABC', 'ABD', 'A', 'XYZ', 'AXYZ']
+        radix = RadixTree(strings)
+        trie = PrefixTree(strings)
+        for prefix in ['', 'A', 'AB', 'XBZ', 'ABXC', 'AYZ', 'XY', 'QQ']:
+            for max_edits in range(3):
+                self.assertCountEqual(radix.complete_fuzzy(prefix, max_edits),
+                                      trie.complete_fuzzy(prefix, max_edits))
+
+    def test_delete_merges_single_child_chains(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        tree.delete('ABC')
+        # Verify node 'B' was merged with its only child 'D'
+        node_A = tree.root.get_child('A')
+        node_BD = node_A.get_child('B')
+        assert node_BD.character == 'BD'
+        assert node_BD.is_terminal() is True
+        assert node_BD.num_children() == 0
+        # Verify deleting 'A' merges it with its only child 'BD'
+        tree.delete('A')
+        node_ABD = tree.root.get_child('A')
+        assert node_ABD.character == 'ABD'
+        assert tree.complete('AB') == ['ABD']
+        assert tree.size == 2
+        tree.delete('ABD')
+        tree.delete('XYZ')
+        assert tree.is_empty() is True
+        assert tree.num_nodes() == 1
+        with self.assertRaises(ValueError):
+            tree.delete('A')
+
+    def test_update_weight(self):
+        tree = RadixTree()
+        tree.insert('ABC', 4)
+        tree.insert('ABD', 9)
+        tree.update_weight('ABD', 1)
+        assert tree.root.max_weight == 4
+        assert tree.complete_top_k('AB', 1) == ['ABC']
+
+    def test_count_completions(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        assert tree.count_completions('') == 4
+        assert tree.count_completions('A') == 3
+        assert tree.count_completions('AB') == 2
+        assert tree.count_completions('XY') == 1
+        assert tree.complete('A', 1, 1) == ['ABC']
+        tree.delete('ABC')
+        assert tree.count_completions('AB') == 1
+        assert tree.complete('', 1) == ['ABD', 'XYZ']
+
+    def test_contains_many(self):
+        tree = RadixTree(['ABC', 'ABD', 'A', 'XYZ'])
+        strings = ['XYZ', 'AB', 'A', 'ABD', 'B', '', 'ABC', 'ABCD', 'A', 'XY']
+        assert tree.contains_many(strings) == \
+            [tree.contains(string) for string in strings]
+
+    def test_from_sorted(self):
+        strings = ['A', 'ABC', 'ABD', 'ABD', 'XYZ']
+        tree = RadixTree.from_sorted(strings)
+        assert isinstance(tree, RadixTree)
+        assert tree.size == 4
+        assert tree.num_nodes() == RadixTree(strings).num_nodes()
+        assert tree.strings() == ['A', 'ABC', 'ABD', 'XYZ']
+        with self.assertRaises(ValueError):
+            RadixTree.from_sorted(['B', 'A'])
+
+
+if __name__ == '__main__':
+    unittest.main()